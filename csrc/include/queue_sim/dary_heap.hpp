@@ -0,0 +1,82 @@
+#pragma once
+
+#include <cstddef>
+#include <utility>
+#include <vector>
+
+namespace queue_sim {
+
+// Min-heap with four children per node over one contiguous vector.
+//
+// Replaces std::priority_queue for SRPT's job queue: sibling groups sit
+// next to each other in memory, the tree is half as deep as a binary heap,
+// and clear() keeps the storage so replications reuse it.  Ordering uses
+// T's operator<, so equal keys pop in an unspecified (but deterministic)
+// order, the same contract as std::priority_queue.
+template <typename T>
+class DAryHeap {
+public:
+    bool empty() const { return data_.empty(); }
+    size_t size() const { return data_.size(); }
+
+    const T &top() const { return data_.front(); }
+
+    void push(const T &value) {
+        data_.push_back(value);
+        sift_up(data_.size() - 1);
+    }
+
+    void pop() {
+        data_.front() = std::move(data_.back());
+        data_.pop_back();
+        if (!data_.empty()) sift_down(0);
+    }
+
+    // Push `value` and pop the minimum in one pass.  When `value` is no
+    // larger than the current top it is returned without touching the heap.
+    T pushpop(const T &value) {
+        if (data_.empty() || !(data_.front() < value)) return value;
+        T smallest = std::move(data_.front());
+        data_.front() = value;
+        sift_down(0);
+        return smallest;
+    }
+
+    void clear() { data_.clear(); }
+
+private:
+    static constexpr size_t kArity = 4;
+
+    std::vector<T> data_;
+
+    void sift_up(size_t i) {
+        T value = std::move(data_[i]);
+        while (i > 0) {
+            size_t parent = (i - 1) / kArity;
+            if (!(value < data_[parent])) break;
+            data_[i] = std::move(data_[parent]);
+            i = parent;
+        }
+        data_[i] = std::move(value);
+    }
+
+    void sift_down(size_t i) {
+        const size_t n = data_.size();
+        T value = std::move(data_[i]);
+        for (;;) {
+            size_t first = kArity * i + 1;
+            if (first >= n) break;
+            size_t last = first + kArity < n ? first + kArity : n;
+            size_t best = first;
+            for (size_t c = first + 1; c < last; ++c) {
+                if (data_[c] < data_[best]) best = c;
+            }
+            if (!(data_[best] < value)) break;
+            data_[i] = std::move(data_[best]);
+            i = best;
+        }
+        data_[i] = std::move(value);
+    }
+};
+
+}  // namespace queue_sim
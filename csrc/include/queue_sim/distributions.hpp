@@ -1,18 +1,72 @@
 #pragma once
 
 #include <cmath>
+#include <cstdint>
 #include <random>
 #include <variant>
 
 namespace queue_sim {
 
+// Marsaglia & Tsang (2000) ziggurat tables for the standard exponential,
+// 256 layers.  Built once on first use; layer i covers [0, w[i] * 2^53).
+struct ExpZiggurat {
+    static constexpr double R = 7.69711747013104972;       // base-layer edge
+    static constexpr double V = 3.949659822581572e-3;      // layer area
+    static constexpr double M = 9007199254740992.0;        // 2^53
+
+    uint64_t k[256];
+    double w[256];
+    double f[256];
+
+    ExpZiggurat() {
+        double de = R, te = R;
+        const double q = V / std::exp(-de);
+        k[0] = static_cast<uint64_t>((de / q) * M);
+        k[1] = 0;
+        w[0] = q / M;
+        w[255] = de / M;
+        f[0] = 1.0;
+        f[255] = std::exp(-de);
+        for (int i = 254; i >= 1; --i) {
+            de = -std::log(V / de + std::exp(-de));
+            k[i + 1] = static_cast<uint64_t>((de / te) * M);
+            te = de;
+            f[i] = std::exp(-de);
+            w[i] = de / M;
+        }
+    }
+
+    static const ExpZiggurat &tables() {
+        static const ExpZiggurat t;
+        return t;
+    }
+
+    // Standard exponential draw.  The common case (~99%) consumes one
+    // 64-bit word: the low 8 bits pick a layer, the top 53 bits are the
+    // uniform offset inside it.
+    static double sample(std::mt19937_64 &rng) {
+        const ExpZiggurat &z = tables();
+        for (;;) {
+            uint64_t word = rng();
+            int i = static_cast<int>(word & 0xFF);
+            uint64_t u = word >> 11;
+            double x = static_cast<double>(u) * z.w[i];
+            if (u < z.k[i]) return x;
+            std::uniform_real_distribution<double> unif(0.0, 1.0);
+            if (i == 0) return R - std::log1p(-unif(rng));  // tail
+            if (z.f[i] + unif(rng) * (z.f[i - 1] - z.f[i]) < std::exp(-x))
+                return x;                                     // wedge
+        }
+    }
+};
+
 struct ExponentialDist {
     double mu;  // rate parameter; E[X] = 1/mu
-    explicit ExponentialDist(double mu) : mu(mu) {}
+    double scale;  // 1/mu, hoisted out of sample()
+    explicit ExponentialDist(double mu) : mu(mu), scale(1.0 / mu) {}
 
     double sample(std::mt19937_64 &rng) const {
-        std::uniform_real_distribution<double> u(0.0, 1.0);
-        return -(1.0 / mu) * std::log(1.0 - u(rng));
+        return scale * ExpZiggurat::sample(rng);
     }
 };
 
@@ -28,13 +82,16 @@ struct UniformDist {
 
 struct BoundedParetoDist {
     double k, p, alpha, C;
+    double k_neg_alpha, neg_inv_alpha;  // per-sample invariants
     BoundedParetoDist(double k, double p, double alpha)
         : k(k), p(p), alpha(alpha),
-          C(std::pow(k, alpha) / (1.0 - std::pow(k / p, alpha))) {}
+          C(std::pow(k, alpha) / (1.0 - std::pow(k / p, alpha))),
+          k_neg_alpha(std::pow(k, -alpha)),
+          neg_inv_alpha(-1.0 / alpha) {}
 
     double sample(std::mt19937_64 &rng) const {
         std::uniform_real_distribution<double> u(0.0, 1.0);
-        return std::pow(-u(rng) / C + std::pow(k, -alpha), -1.0 / alpha);
+        return std::pow(-u(rng) / C + k_neg_alpha, neg_inv_alpha);
     }
 };
 
@@ -1,30 +1,30 @@
 #pragma once
-#include <string>
+#include <cstdint>
 #include <vector>
 
 namespace queue_sim {
 
 struct EventLog {
-    // -- Event kind constants (match Python EventLog) --
-    static constexpr const char* ARRIVAL    = "arrival";
-    static constexpr const char* DEPARTURE  = "departure";
-    static constexpr const char* ROUTE      = "route";
-    static constexpr const char* REJECTION  = "rejection";
+    // -- Event kind codes (match Python EventLog) --
+    static constexpr int8_t ARRIVAL    = 0;
+    static constexpr int8_t DEPARTURE  = 1;
+    static constexpr int8_t ROUTE      = 2;
+    static constexpr int8_t REJECTION  = 3;
 
     // -- Special server indices --
     static constexpr int EXTERNAL    = -1;
     static constexpr int SYSTEM_EXIT = -1;
 
     std::vector<double> times;
-    std::vector<std::string> kinds;
+    std::vector<int8_t> kinds;
     std::vector<int> from_servers;
     std::vector<int> to_servers;
     std::vector<int> states;
 
-    void push(double time, const char* kind,
+    void push(double time, int8_t kind,
               int from_server, int to_server, int state) {
         times.push_back(time);
-        kinds.emplace_back(kind);
+        kinds.push_back(kind);
         from_servers.push_back(from_server);
         to_servers.push_back(to_server);
         states.push_back(state);
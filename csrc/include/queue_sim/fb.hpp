@@ -8,7 +8,7 @@
 
 namespace queue_sim {
 
-class FB : public Server {
+class FB final : public Server {
 public:
     struct Job {
         double remaining;
@@ -77,8 +77,8 @@ public:
                     jobs.erase(it);
                     state -= 1;
                     num_completions += 1;
-                    double n = static_cast<double>(num_completions);
-                    T = T * (n - 1.0) / n + response_time / n;
+                    _sum_T += response_time;
+                    T = _sum_T / num_completions;
                     recalcTTNC();
                     return true;
                 }
@@ -1,7 +1,6 @@
 #pragma once
 
 #include <algorithm>
-#include <deque>
 #include <limits>
 #include <vector>
 
@@ -9,12 +8,12 @@
 
 namespace queue_sim {
 
-class FCFS : public Server {
+class FCFS final : public Server {
 public:
     // Multi-server state (only used when num_servers > 1)
     std::vector<double> channelRemaining;
     std::vector<double> channelArrivals;
-    std::deque<double> waitQueue;
+    RingBuffer<double> waitQueue;
 
     explicit FCFS(Distribution sizeDist, int num_servers = 1,
                   int buffer_capacity = -1)
@@ -82,8 +81,8 @@ public:
             double response_time = clock - channelArrivals[idx];
             _last_response_time = response_time;
             num_completions += 1;
-            double n = static_cast<double>(num_completions);
-            T = T * (n - 1.0) / n + response_time / n;
+            _sum_T += response_time;
+            T = _sum_T / num_completions;
 
             // Remove completed channel
             channelRemaining.erase(it);
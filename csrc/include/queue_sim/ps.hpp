@@ -8,7 +8,7 @@
 
 namespace queue_sim {
 
-class PS : public Server {
+class PS final : public Server {
 public:
     std::vector<double> remaining;
     std::vector<double> jobArrivals;
@@ -60,8 +60,8 @@ public:
             jobArrivals.erase(jobArrivals.begin() + idx);
             state -= 1;
             num_completions += 1;
-            double n = static_cast<double>(num_completions);
-            T = T * (n - 1.0) / n + response_time / n;
+            _sum_T += response_time;
+            T = _sum_T / num_completions;
             recalcTTNC();
             return true;
         }
@@ -1,10 +1,12 @@
 #pragma once
 
 #include <algorithm>
+#include <atomic>
 #include <cmath>
 #include <cstdint>
 #include <limits>
 #include <memory>
+#include <numeric>
 #include <random>
 #include <stdexcept>
 #include <string>
@@ -14,7 +16,11 @@
 
 #include "distributions.hpp"
 #include "event_log.hpp"
+#include "fb.hpp"
+#include "fcfs.hpp"
+#include "ps.hpp"
 #include "server.hpp"
+#include "srpt.hpp"
 
 namespace queue_sim {
 
@@ -84,7 +90,19 @@ public:
         event_log.clear();
         EventLog* el_ptr = nullptr;
         if (track_events) {
-            event_log.reserve(num_events * 2);
+            // A tandem completion logs one arrival, one route per hop and
+            // one departure; with random routing the visit count is not
+            // known up front, so fall back to an arrival/departure pair.
+            // External rejections are logged without counting towards
+            // num_events, so finite buffers get one extra slot per job.
+            size_t per_job = transitionMatrix.empty() ? servers.size() + 1 : 2;
+            for (const auto &s : servers) {
+                if (s->buffer_capacity >= 0) {
+                    per_job += 1;
+                    break;
+                }
+            }
+            event_log.reserve(static_cast<size_t>(num_events) * per_job);
             el_ptr = &event_log;
         }
         auto [mean_n, mean_t] = sim_internal(
@@ -122,7 +140,13 @@ public:
         result.raw_N.resize(n_replications);
         result.raw_T.resize(n_replications);
 
-        auto worker = [&](int start, int end) {
+        // Replications are handed out one at a time from a shared counter
+        // so a thread that draws short runs keeps pulling work instead of
+        // idling behind a static chunk.  Each replication's seed depends
+        // only on its index, so results are independent of scheduling.
+        std::atomic<int> next_rep{0};
+
+        auto worker = [&]() {
             // Clone servers once for this thread
             std::vector<std::shared_ptr<Server>> local_servers;
             local_servers.reserve(servers.size());
@@ -130,7 +154,8 @@ public:
                 local_servers.push_back(s->clone());
             }
 
-            for (int i = start; i < end; ++i) {
+            for (int i = next_rep.fetch_add(1); i < n_replications;
+                 i = next_rep.fetch_add(1)) {
                 uint64_t rep_seed =
                     derive_seed(base_seed, static_cast<uint64_t>(i));
                 auto [n, t] = sim_internal(
@@ -142,17 +167,12 @@ public:
         };
 
         if (actual_threads == 1) {
-            worker(0, n_replications);
+            worker();
         } else {
             std::vector<std::thread> threads;
             threads.reserve(actual_threads);
-            int chunk = n_replications / actual_threads;
-            int remainder = n_replications % actual_threads;
-            int start = 0;
             for (int t = 0; t < actual_threads; ++t) {
-                int end = start + chunk + (t < remainder ? 1 : 0);
-                threads.emplace_back(worker, start, end);
-                start = end;
+                threads.emplace_back(worker);
             }
             for (auto& th : threads) {
                 th.join();
@@ -200,22 +220,32 @@ private:
         return m;
     }
 
+    // Each transition-matrix row as a running sum, built once per sim so
+    // routing is a binary search instead of re-accumulating the row.
+    static std::vector<std::vector<double>> cumulativeRows(
+            const std::vector<std::vector<double>>& tm) {
+        std::vector<std::vector<double>> cum(tm.size());
+        for (size_t i = 0; i < tm.size(); ++i) {
+            cum[i].resize(tm[i].size());
+            std::partial_sum(tm[i].begin(), tm[i].end(), cum[i].begin());
+        }
+        return cum;
+    }
+
     static int routeJob(int server_idx, std::mt19937_64 &rng,
-                         const std::vector<std::vector<double>>& tm,
+                         const std::vector<std::vector<double>>& cum,
                          int n_servers) {
-        if (tm.empty()) {
+        if (cum.empty()) {
             return server_idx + 1;
         }
         std::uniform_real_distribution<double> u(0.0, 1.0);
         double r = u(rng);
-        double acc = 0.0;
-        const auto &row = tm[server_idx];
-        for (int i = 0; i < static_cast<int>(row.size()); ++i) {
-            acc += row[i];
-            if (r < acc) return i;
-        }
-        // Numerical safety: fall through -> exit
-        return n_servers;
+        // First destination whose cumulative probability exceeds r.
+        const auto &row = cum[server_idx];
+        int dest = static_cast<int>(
+            std::upper_bound(row.begin(), row.end(), r) - row.begin());
+        // Numerical safety: falling off the end -> exit
+        return std::min(dest, n_servers);
     }
 
     static std::pair<double, double> sim_internal(
@@ -229,12 +259,36 @@ private:
             EventLog* event_log = nullptr) {
         std::mt19937_64 rng(seed);
         int n_servers = static_cast<int>(srvs.size());
+        const auto cum = cumulativeRows(tm);
 
         for (auto &s : srvs) {
             s->setRNG(&rng);
             s->reset();
         }
 
+        // A lone server with no routing matrix always sends completions to
+        // the exit: run the specialised loop on the concrete policy type.
+        if (n_servers == 1 && cum.empty()) {
+            Server *s = srvs[0].get();
+            if (auto *p = dynamic_cast<FCFS *>(s))
+                return sim_single_server(*p, arrival_dist, rng, num_events,
+                                         warmup, response_times, event_log);
+            if (auto *p = dynamic_cast<SRPT *>(s))
+                return sim_single_server(*p, arrival_dist, rng, num_events,
+                                         warmup, response_times, event_log);
+            if (auto *p = dynamic_cast<PS *>(s))
+                return sim_single_server(*p, arrival_dist, rng, num_events,
+                                         warmup, response_times, event_log);
+            if (auto *p = dynamic_cast<FB *>(s))
+                return sim_single_server(*p, arrival_dist, rng, num_events,
+                                         warmup, response_times, event_log);
+        }
+
+        // Reused every event (clear() keeps the capacity) instead of
+        // allocating a fresh vector whenever a completion fires.
+        std::vector<int> completed;
+        completed.reserve(n_servers);
+
         int num_completions = 0;
         double ttna = sample(arrival_dist, rng);
         int state = 0;
@@ -245,14 +299,14 @@ private:
             while (warmup_done < warmup) {
                 double ttnc = minTTNC(srvs);
                 double ttne = std::min(ttnc, ttna);
-                std::vector<int> completed;
+                completed.clear();
                 for (int i = 0; i < n_servers; ++i) {
                     if (srvs[i]->update(ttne)) {
                         completed.push_back(i);
                     }
                 }
                 for (int idx : completed) {
-                    int dest = routeJob(idx, rng, tm, n_servers);
+                    int dest = routeJob(idx, rng, cum, n_servers);
                     if (dest >= n_servers) {
                         warmup_done += 1;
                         state -= 1;
@@ -300,7 +354,7 @@ private:
             clock += ttne;
             area_n += static_cast<double>(state) * ttne;
 
-            std::vector<int> completed;
+            completed.clear();
             for (int i = 0; i < n_servers; ++i) {
                 if (srvs[i]->update(ttne)) {
                     completed.push_back(i);
@@ -308,7 +362,7 @@ private:
             }
 
             for (int idx : completed) {
-                int dest = routeJob(idx, rng, tm, n_servers);
+                int dest = routeJob(idx, rng, cum, n_servers);
                 if (dest >= n_servers) {
                     num_completions += 1;
                     state -= 1;
@@ -361,6 +415,96 @@ private:
         double mean_t = area_n / std::max(1, num_completions);
         return {mean_n, mean_t};
     }
+
+    // Single server, no routing: sim_internal's loop with the completion
+    // list, the route draw and the min-TTNC scan dropped.  Policy is the
+    // concrete (final) server class, so its update()/arrival() calls are
+    // direct.  Consumes the RNG in exactly the same order as the general
+    // loop, so results are identical.
+    template <typename Policy>
+    static std::pair<double, double> sim_single_server(
+            Policy &srv,
+            Distribution &arrival_dist,
+            std::mt19937_64 &rng,
+            int num_events,
+            int warmup,
+            std::vector<double>* response_times,
+            EventLog* event_log) {
+        int num_completions = 0;
+        double ttna = sample(arrival_dist, rng);
+        int state = 0;
+
+        // -- warmup phase (no accumulation) ----------------------------------
+        int warmup_done = 0;
+        while (warmup_done < warmup) {
+            double ttnc = srv.TTNC;
+            if (srv.update(std::min(ttnc, ttna))) {
+                warmup_done += 1;
+                state -= 1;
+            }
+            if (ttna <= ttnc) {
+                srv.num_arrivals += 1;
+                if (srv.is_full()) {
+                    srv.num_rejected += 1;
+                } else {
+                    state += 1;
+                    srv.arrival();
+                }
+                ttna = sample(arrival_dist, rng);
+            } else {
+                ttna -= ttnc;
+            }
+        }
+
+        srv.num_rejected = 0;
+        srv.num_arrivals = 0;
+
+        // -- measurement phase -----------------------------------------------
+        double area_n = 0.0;
+        double clock = 0.0;
+
+        while (num_completions < num_events) {
+            double ttnc = srv.TTNC;
+            double ttne = std::min(ttnc, ttna);
+
+            clock += ttne;
+            area_n += static_cast<double>(state) * ttne;
+
+            if (srv.update(ttne)) {
+                num_completions += 1;
+                state -= 1;
+                if (response_times) {
+                    response_times->push_back(srv._last_response_time);
+                }
+                if (event_log) {
+                    event_log->push(clock, EventLog::DEPARTURE, 0, EventLog::SYSTEM_EXIT, state);
+                }
+            }
+
+            if (ttna <= ttnc) {
+                srv.num_arrivals += 1;
+                if (srv.is_full()) {
+                    srv.num_rejected += 1;
+                    if (event_log) {
+                        event_log->push(clock, EventLog::REJECTION, EventLog::EXTERNAL, 0, state);
+                    }
+                } else {
+                    state += 1;
+                    srv.arrival();
+                    if (event_log) {
+                        event_log->push(clock, EventLog::ARRIVAL, EventLog::EXTERNAL, 0, state);
+                    }
+                }
+                ttna = sample(arrival_dist, rng);
+            } else {
+                ttna -= ttne;
+            }
+        }
+
+        double mean_n = area_n / clock;
+        double mean_t = area_n / std::max(1, num_completions);
+        return {mean_n, mean_t};
+    }
 };
 
 }  // namespace queue_sim
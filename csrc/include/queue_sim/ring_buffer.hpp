@@ -0,0 +1,58 @@
+#pragma once
+
+#include <cstddef>
+#include <utility>
+#include <vector>
+
+namespace queue_sim {
+
+// FIFO queue over one contiguous power-of-two buffer.
+//
+// Replaces std::deque<double> for per-server arrival-time queues: push/pop
+// are an index mask instead of deque's block bookkeeping, and clear() keeps
+// the storage so replications reuse it instead of reallocating.
+template <typename T>
+class RingBuffer {
+public:
+    RingBuffer() : buf_(kInitialCapacity) {}
+
+    bool empty() const { return size_ == 0; }
+    size_t size() const { return size_; }
+
+    T &front() { return buf_[head_]; }
+    const T &front() const { return buf_[head_]; }
+
+    void push_back(const T &value) {
+        if (size_ == buf_.size()) grow();
+        buf_[(head_ + size_) & (buf_.size() - 1)] = value;
+        ++size_;
+    }
+
+    void pop_front() {
+        head_ = (head_ + 1) & (buf_.size() - 1);
+        --size_;
+    }
+
+    void clear() {
+        head_ = 0;
+        size_ = 0;
+    }
+
+private:
+    static constexpr size_t kInitialCapacity = 16;  // must be a power of two
+
+    std::vector<T> buf_;
+    size_t head_ = 0;
+    size_t size_ = 0;
+
+    void grow() {
+        std::vector<T> bigger(buf_.size() * 2);
+        for (size_t i = 0; i < size_; ++i) {
+            bigger[i] = std::move(buf_[(head_ + i) & (buf_.size() - 1)]);
+        }
+        buf_ = std::move(bigger);
+        head_ = 0;
+    }
+};
+
+}  // namespace queue_sim
@@ -1,12 +1,12 @@
 #pragma once
 
 #include <cmath>
-#include <deque>
 #include <limits>
 #include <random>
 #include <stdexcept>
 
 #include "distributions.hpp"
+#include "ring_buffer.hpp"
 
 namespace queue_sim {
 
@@ -18,9 +18,10 @@ public:
     double clock = 0.0;
     double TTNC = std::numeric_limits<double>::infinity();
     double T = 0.0;
+    double _sum_T = 0.0;  // running sum of response times; T = _sum_T / n
     int num_completions = 0;
     int state = 0;
-    std::deque<double> arrivalTimes;
+    RingBuffer<double> arrivalTimes;
 
     int num_servers;
     int buffer_capacity;
@@ -49,6 +50,7 @@ public:
         clock = 0.0;
         TTNC = std::numeric_limits<double>::infinity();
         T = 0.0;
+        _sum_T = 0.0;
         num_completions = 0;
         state = 0;
         num_rejected = 0;
@@ -63,8 +65,8 @@ public:
         double t = clock - arrivalTimes.front();
         arrivalTimes.pop_front();
         _last_response_time = t;
-        double n = static_cast<double>(num_completions);
-        T = T * (n - 1.0) / n + t / n;
+        _sum_T += t;
+        T = _sum_T / num_completions;
     }
 
     virtual void arrival() {
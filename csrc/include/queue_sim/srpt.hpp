@@ -1,21 +1,19 @@
 #pragma once
 
 #include <algorithm>
-#include <functional>
 #include <limits>
-#include <queue>
 #include <utility>
-#include <vector>
 
+#include "dary_heap.hpp"
 #include "server.hpp"
 
 namespace queue_sim {
 
-class SRPT : public Server {
+class SRPT final : public Server {
 public:
     // min-heap: (remaining, arrival_time) — sorted by remaining first
     using Job = std::pair<double, double>;
-    std::priority_queue<Job, std::vector<Job>, std::greater<Job>> jobs;
+    DAryHeap<Job> jobs;
     double _running_arrival_time = 0.0;
 
     explicit SRPT(Distribution sizeDist, int buffer_capacity = -1)
@@ -27,7 +25,7 @@ public:
 
     void reset() override {
         Server::reset();
-        jobs = {};
+        jobs.clear();
         _running_arrival_time = 0.0;
     }
 
@@ -41,17 +39,19 @@ public:
     void updateET() override {
         double t = clock - _running_arrival_time;
         _last_response_time = t;
-        double n = static_cast<double>(num_completions);
-        T = T * (n - 1.0) / n + t / n;
+        _sum_T += t;
+        T = _sum_T / num_completions;
     }
 
     void arrival() override {
+        Job incoming{sample(sizeDist, *rng), clock};
         if (state > 0) {
+            // The preempted job rejoins the queue; whichever of it, the
+            // newcomer and the queued jobs is shortest runs next.
             jobs.push({TTNC, _running_arrival_time});
+            incoming = jobs.pushpop(incoming);
         }
-        jobs.push({sample(sizeDist, *rng), clock});
-        auto [remaining, arr] = jobs.top();
-        jobs.pop();
+        auto [remaining, arr] = incoming;
         TTNC = remaining;
         _running_arrival_time = arr;
         state += 1;
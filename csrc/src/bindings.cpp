@@ -117,10 +117,13 @@ PYBIND11_MODULE(_queue_sim_cpp, m) {
         .def_readonly("to_servers", &EventLog::to_servers)
         .def_readonly("states", &EventLog::states)
         .def("__len__", &EventLog::size)
-        .def_property_readonly_static("ARRIVAL", [](py::object) { return EventLog::ARRIVAL; })
-        .def_property_readonly_static("DEPARTURE", [](py::object) { return EventLog::DEPARTURE; })
-        .def_property_readonly_static("ROUTE", [](py::object) { return EventLog::ROUTE; })
-        .def_property_readonly_static("REJECTION", [](py::object) { return EventLog::REJECTION; })
+        .def_property_readonly_static("ARRIVAL", [](py::object) { return static_cast<int>(EventLog::ARRIVAL); })
+        .def_property_readonly_static("DEPARTURE", [](py::object) { return static_cast<int>(EventLog::DEPARTURE); })
+        .def_property_readonly_static("ROUTE", [](py::object) { return static_cast<int>(EventLog::ROUTE); })
+        .def_property_readonly_static("REJECTION", [](py::object) { return static_cast<int>(EventLog::REJECTION); })
+        .def_property_readonly_static("KIND_NAMES", [](py::object) {
+            return py::make_tuple("arrival", "departure", "route", "rejection");
+        })
         .def_property_readonly_static("EXTERNAL", [](py::object) { return EventLog::EXTERNAL; })
         .def_property_readonly_static("SYSTEM_EXIT", [](py::object) { return EventLog::SYSTEM_EXIT; });
 
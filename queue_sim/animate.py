@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
+from .event_log import EventLog
+
 if TYPE_CHECKING:
     import matplotlib.animation
     import matplotlib.figure
@@ -29,14 +31,22 @@ def _import_deps():
 
 def _infer_edges(log) -> set[tuple[int, int]]:
     """Infer directed edges from observed ROUTE events in the log."""
-    edges: set[tuple[int, int]] = set()
-    for i in range(len(log)):
-        if log.kinds[i] == "route":
-            fr = log.from_servers[i]
-            to = log.to_servers[i]
-            if fr >= 0 and to >= 0:
-                edges.add((fr, to))
-    return edges
+    # Fetch each column once: the C++ EventLog returns a fresh list on every
+    # attribute access, so indexing ``log.kinds[i]`` in a loop is quadratic.
+    return {
+        (fr, to)
+        for kind, fr, to in zip(log.kinds, log.from_servers, log.to_servers)
+        if kind == EventLog.ROUTE and fr >= 0 and to >= 0
+    }
+
+
+def _exit_servers(log) -> set[int]:
+    """Servers observed sending a job out of the system."""
+    return {
+        fr
+        for kind, fr in zip(log.kinds, log.from_servers)
+        if kind == EventLog.DEPARTURE and fr >= 0
+    }
 
 
 def _layout_positions(
@@ -116,23 +126,18 @@ def animate_network(
         ``matplotlib.animation.FuncAnimation`` — call ``.save()`` or display
         inline in Jupyter.
     """
-    from .event_log import _bin_step_function, per_server_states
+    from .event_log import _bin_step_function, _server_state_arrays
 
     plt, animation_mod = _import_deps()
 
-    data = per_server_states(log, n_servers=n_servers)
-    n_srv = len(data["server_states"])
-    times_arr = np.array(data["times"])
+    times_arr, server_states = _server_state_arrays(log, n_servers)
+    n_srv = len(server_states)
 
     t_max = times_arr[-1] if len(times_arr) > 0 else 1.0
     bin_edges = np.linspace(0, t_max, n_frames + 1)
 
-    # Bin each server's occupancy
-    grids = np.zeros((n_srv, n_frames))
-    for s in range(n_srv):
-        grids[s] = _bin_step_function(
-            times_arr, data["server_states"][s], bin_edges
-        )
+    # Bin every server's occupancy in one pass
+    grids = _bin_step_function(times_arr, server_states, bin_edges)
 
     vmax = max(float(grids.max()), 1.0)
     colormap = plt.get_cmap(cmap)
@@ -181,13 +186,7 @@ def animate_network(
         ax.text(x0 - 0.17, y0, "arr", ha="right", va="center", fontsize=8)
 
     # Draw departure arrows from exit servers
-    exit_servers = set()
-    for i in range(len(log)):
-        if log.kinds[i] == "departure":
-            fr = log.from_servers[i]
-            if fr >= 0:
-                exit_servers.add(fr)
-    for s in exit_servers:
+    for s in _exit_servers(log):
         if s in pos:
             x0, y0 = pos[s]
             ax.annotate(
@@ -197,12 +196,16 @@ def animate_network(
                 arrowprops={"arrowstyle": "->", "color": "indianred", "lw": 2},
             )
 
+    # Per-frame node colors and label colors, computed once up front
+    frame_colors = colormap(norm(grids.T))  # (n_frames, n_srv, 4)
+    # Dark text on bright nodes, white on dark nodes
+    label_colors = np.where(grids.T / vmax > 0.5, "black", "white")
+
     # Server node circles (initial)
     node_xs = [pos[s][0] for s in range(n_srv)]
     node_ys = [pos[s][1] for s in range(n_srv)]
-    initial_colors = [colormap(norm(grids[s, 0])) for s in range(n_srv)]
     scatter = ax.scatter(
-        node_xs, node_ys, s=node_size, c=initial_colors,
+        node_xs, node_ys, s=node_size, c=frame_colors[0],
         edgecolors="black", linewidths=1.5, zorder=5,
     )
 
@@ -236,13 +239,10 @@ def animate_network(
         fig.colorbar(sm, ax=ax, label="Occupancy", shrink=0.6)
 
     def _update(frame):
-        colors = [colormap(norm(grids[s, frame])) for s in range(n_srv)]
-        scatter.set_facecolors(colors)
+        scatter.set_facecolors(frame_colors[frame])
         for s in range(n_srv):
-            val = grids[s, frame]
-            occ_texts[s].set_text(f"{val:.0f}")
-            # Dark text on bright nodes, white on dark nodes
-            occ_texts[s].set_color("black" if val / vmax > 0.5 else "white")
+            occ_texts[s].set_text(f"{grids[s, frame]:.0f}")
+            occ_texts[s].set_color(label_colors[frame, s])
         t = (bin_edges[frame] + bin_edges[frame + 1]) / 2
         time_text.set_text(f"t = {t:.2f}")
         return (scatter, time_text, *occ_texts)
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+from array import array
+
 
 class EventLog:
     """Record of simulation events with parallel-vector storage."""
 
-    # -- Event kind constants --
-    ARRIVAL: str = "arrival"
-    DEPARTURE: str = "departure"
-    ROUTE: str = "route"
-    REJECTION: str = "rejection"
+    # -- Event kind codes (``kinds`` stores these as int8) --
+    ARRIVAL: int = 0
+    DEPARTURE: int = 1
+    ROUTE: int = 2
+    REJECTION: int = 3
+
+    # Human-readable name for each kind code: ``KIND_NAMES[log.kinds[i]]``
+    KIND_NAMES: tuple[str, ...] = ("arrival", "departure", "route", "rejection")
 
     # -- Special server indices --
     EXTERNAL: int = -1
@@ -19,14 +24,16 @@ class EventLog:
     __slots__ = ("times", "kinds", "from_servers", "to_servers", "states")
 
     def __init__(self) -> None:
-        self.times: list[float] = []
-        self.kinds: list[str] = []
-        self.from_servers: list[int] = []
-        self.to_servers: list[int] = []
-        self.states: list[int] = []
+        # Typed columns: unboxed 8/1/4-byte values instead of one PyObject per
+        # field, and NumPy can wrap them without copying (buffer protocol).
+        self.times: array = array("d")
+        self.kinds: array = array("b")
+        self.from_servers: array = array("i")
+        self.to_servers: array = array("i")
+        self.states: array = array("i")
 
     def _append(
-        self, time: float, kind: str, from_server: int, to_server: int, state: int
+        self, time: float, kind: int, from_server: int, to_server: int, state: int
     ) -> None:
         self.times.append(time)
         self.kinds.append(kind)
@@ -45,6 +52,8 @@ def per_server_states(
     """Reconstruct per-server occupancy from an event log.
 
     Works with both Python and C++ EventLog objects via duck typing.
+    Uses NumPy when it is installed and falls back to a pure-Python scan
+    otherwise; both produce identical output.
 
     Args:
         log: An EventLog (Python or C++) with times, kinds, from_servers,
@@ -56,56 +65,115 @@ def per_server_states(
         ``server_states[s][i]`` is the occupancy of server *s* after event *i*.
 
     Raises:
-        ValueError: If the log is empty.
+        ValueError: If the log is empty, or *n_servers* is smaller than the
+            number of servers the log references.
     """
     if len(log) == 0:
         raise ValueError("Event log is empty")
 
-    kinds = log.kinds
-    from_servers = log.from_servers
-    to_servers = log.to_servers
-    times = log.times
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        # Fetch each column once (the C++ log copies on every attribute access).
+        from_servers = log.from_servers
+        to_servers = log.to_servers
+        needed = max(max(from_servers), max(to_servers)) + 1
+        if n_servers is None:
+            n_servers = needed
+        elif n_servers < needed:
+            raise ValueError(_too_few_servers(n_servers, needed))
+        server_states = _server_states_py(log.kinds, from_servers, to_servers, n_servers)
+        return {"times": list(log.times), "server_states": server_states}
+
+    times, server_states = _server_state_arrays(log, n_servers)
+    return {"times": times.tolist(), "server_states": server_states.tolist()}
+
+
+def _too_few_servers(n_servers, needed):
+    # Index n_servers is the sink row, so a short count would silently drop
+    # that server's occupancy instead of failing.
+    return (
+        f"n_servers={n_servers} is too small: the log references server "
+        f"{needed - 1}"
+    )
+
+
+# (delta to from_server, delta to to_server) for each kind code.  External
+# arrivals and rejections have from == -1 and departures have to == -1;
+# those updates land in a sink slot at the end of ``pops`` (``pops[-1]``).
+_KIND_DELTAS = (
+    (0, +1),   # ARRIVAL
+    (-1, 0),   # DEPARTURE
+    (-1, +1),  # ROUTE
+    (-1, 0),   # REJECTION (routed: source loses the job; external: sink)
+)
+
+
+def _server_states_py(kinds, from_servers, to_servers, n_servers):
+    """Pure-Python occupancy reconstruction (one pass over the events)."""
+    pops = [0] * (n_servers + 1)
+    deltas = _KIND_DELTAS
+    # Snapshot all of ``pops`` (sink included) into one flat list per event;
+    # a single C-level extend beats n_servers separate appends, and each
+    # server's column is then a strided slice.
+    flat: list[int] = []
+    extend = flat.extend
+
+    for kind, fr, to in zip(kinds, from_servers, to_servers):
+        d_from, d_to = deltas[kind]
+        pops[fr] += d_from
+        pops[to] += d_to
+        extend(pops)
+
+    stride = n_servers + 1
+    return [flat[s::stride] for s in range(n_servers)]
+
+
+def _server_state_arrays(log, n_servers: int | None = None):
+    """Vectorized occupancy reconstruction (requires NumPy).
+
+    Returns ``(times, server_states)`` as arrays of shape ``(n,)`` and
+    ``(n_servers, n)``; the plotting helpers use these directly instead of
+    round-tripping through :func:`per_server_states`' lists.
+
+    Each event scatters its +1/-1 into a ``(n_servers + 1, n)`` delta matrix
+    whose cumulative sum along the event axis is the occupancy.  The extra
+    last row is a sink for the ``-1`` (external / exit) server index, so
+    external rejections need no special case.
+    """
+    import numpy as np
+
+    n_events = len(log)
+    if n_events == 0:
+        raise ValueError("Event log is empty")
+
+    # Zero-copy views of the Python log's typed columns; the C++ log hands
+    # back lists, which are converted.  fr/to are copied (intp) since the
+    # exit/external indices are rewritten below.
+    times = np.asarray(log.times, dtype=np.float64)
+    codes = np.asarray(log.kinds, dtype=np.int8)
+    fr = np.array(log.from_servers, dtype=np.intp)
+    to = np.array(log.to_servers, dtype=np.intp)
 
+    needed = int(max(fr.max(), to.max())) + 1
     if n_servers is None:
-        max_idx = -1
-        for v in from_servers:
-            if v >= 0 and v > max_idx:
-                max_idx = v
-        for v in to_servers:
-            if v >= 0 and v > max_idx:
-                max_idx = v
-        n_servers = max_idx + 1
-
-    pops = [0] * n_servers
-    result_times: list[float] = []
-    server_states: list[list[int]] = [[] for _ in range(n_servers)]
-
-    for i in range(len(log)):
-        kind = kinds[i]
-        fr = from_servers[i]
-        to = to_servers[i]
-
-        if kind == "arrival":
-            # External arrival: from == -1, to == server index
-            pops[to] += 1
-        elif kind == "departure":
-            # Departure from system: from == server index, to == -1
-            pops[fr] -= 1
-        elif kind == "route":
-            # Routed: from server -> to server
-            pops[fr] -= 1
-            pops[to] += 1
-        elif kind == "rejection":
-            # Rejection: if from >= 0 (routed rejection), decrement source
-            # If from == -1 (external rejection), no change
-            if fr >= 0:
-                pops[fr] -= 1
-
-        result_times.append(times[i])
-        for s in range(n_servers):
-            server_states[s].append(pops[s])
-
-    return {"times": result_times, "server_states": server_states}
+        n_servers = needed
+    elif n_servers < needed:
+        raise ValueError(_too_few_servers(n_servers, needed))
+    sink = n_servers
+    fr[fr < 0] = sink
+    to[to < 0] = sink
+
+    is_route = codes == EventLog.ROUTE
+    inc = (codes == EventLog.ARRIVAL) | is_route
+    dec = (codes == EventLog.DEPARTURE) | (codes == EventLog.REJECTION) | is_route
+
+    events = np.arange(n_events)
+    deltas = np.zeros((n_servers + 1, n_events), dtype=np.int64)
+    deltas[to[inc], events[inc]] += 1
+    deltas[fr[dec], events[dec]] -= 1
+
+    return times, np.cumsum(deltas[:sink], axis=1)
 
 
 def _bin_step_function(
@@ -117,58 +185,48 @@ def _bin_step_function(
 
     Given a step function defined by *times* and *values* (value changes at
     each time), compute the time-weighted average in each bin defined by
-    *bin_edges*.
+    *bin_edges*.  *values* may also be a ``(k, n)`` stack of step functions
+    sharing the same *times* (e.g. every server's occupancy), in which case
+    all rows are binned in one pass.
 
     Args:
         times: Sorted event times (length *n*).
-        values: Value of the step function after each event (length *n*).
+        values: Value of the step function after each event (length *n*),
+            or a ``(k, n)`` array of such functions.
         bin_edges: Sorted bin boundaries (length *n_bins + 1*).
 
     Returns:
-        Array of shape ``(n_bins,)`` with the time-weighted average per bin.
+        Array of shape ``(n_bins,)`` (or ``(k, n_bins)`` for 2-D *values*)
+        with the time-weighted average per bin.
     """
     import numpy as np
 
     times = np.asarray(times, dtype=float)
     values = np.asarray(values, dtype=float)
+    bin_edges = np.asarray(bin_edges, dtype=float)
     n_bins = len(bin_edges) - 1
 
-    result = np.zeros(n_bins)
+    result = np.zeros(values.shape[:-1] + (n_bins,))
     if len(times) == 0:
         return result
 
     # Build the full step-function breakpoints: prepend time=0 with value=0,
     # then each event time with the corresponding value.
-    bp_times = np.empty(len(times) + 1)
-    bp_values = np.empty(len(times) + 1)
-    bp_times[0] = 0.0
-    bp_values[0] = 0.0
-    bp_times[1:] = times
-    bp_values[1:] = values
-
-    for b in range(n_bins):
-        lo = bin_edges[b]
-        hi = bin_edges[b + 1]
-        if hi <= lo:
-            continue
-
-        # Find breakpoints that fall within [lo, hi)
-        i_start = np.searchsorted(bp_times, lo, side="right") - 1
-        i_end = np.searchsorted(bp_times, hi, side="right") - 1
-
-        area = 0.0
-        cursor = lo
-        for j in range(max(i_start, 0), min(i_end + 1, len(bp_times))):
-            seg_end = bp_times[j + 1] if j + 1 < len(bp_times) else hi
-            seg_end = min(seg_end, hi)
-            if seg_end > cursor:
-                area += bp_values[j] * (seg_end - cursor)
-                cursor = seg_end
-
-        # Handle remaining time in the bin after the last breakpoint
-        if cursor < hi:
-            area += bp_values[min(i_end, len(bp_values) - 1)] * (hi - cursor)
-
-        result[b] = area / (hi - lo)
+    bp_times = np.concatenate(([0.0], times))
+    bp_values = np.concatenate(
+        (np.zeros(values.shape[:-1] + (1,)), values), axis=-1,
+    )
+
+    # Integral of the step function up to each breakpoint; the integral up
+    # to any t is then the one at the last breakpoint <= t plus the tail.
+    area = np.zeros_like(bp_values)
+    np.cumsum(bp_values[..., :-1] * np.diff(bp_times), axis=-1, out=area[..., 1:])
+
+    idx = np.maximum(np.searchsorted(bp_times, bin_edges, side="right") - 1, 0)
+    cum = area[..., idx] + bp_values[..., idx] * (bin_edges - bp_times[idx])
+
+    widths = np.diff(bin_edges)
+    valid = widths > 0
+    result[..., valid] = np.diff(cum, axis=-1)[..., valid] / widths[valid]
 
     return result
@@ -1,5 +1,4 @@
 # display_system.py
-from collections import defaultdict, deque
 
 
 def _server_label(s, idx):
@@ -14,10 +13,9 @@ def _build_edges(servers, P):
     for i in range(n):
         row = P[i]
         upto = n if has_exit_col else len(row)
-        for j in range(upto):
-            p = row[j]
-            if p and p > 0:
-                edges.append((i, j, float(p)))
+        # one slice + enumerate instead of per-cell row[j] lookups (works the
+        # same for list rows and NumPy rows)
+        edges.extend((i, j, float(p)) for j, p in enumerate(row[:upto]) if p and p > 0)
         if not has_exit_col:
             r = 1.0 - sum(row)
             if r > 1e-12:
@@ -31,32 +29,34 @@ def _build_edges(servers, P):
 def display_system_ascii(servers, P):
     """ASCII, layer-ish layout via Kahn on the non-exit subgraph."""
     n = len(servers)
-    labels = {i: _server_label(servers[i], i) for i in range(n)}
+    # nodes are 0..n-1, so plain lists indexed by node replace dicts
+    labels = [_server_label(s, i) for i, s in enumerate(servers)]
     edges = _build_edges(servers, P)
 
     # Build graph (excluding EXIT for layering)
-    out = defaultdict(list)
-    indeg = defaultdict(int, {i:0 for i in range(n)})
+    out = [[] for _ in range(n)]
+    indeg = [0] * n
     for u,v,p in edges:
         if v == "EXIT":
             continue
         out[u].append((v,p))
         indeg[v] += 1
 
-    # Kahn layering (if cycles, fall back to single layer)
-    q = deque([i for i in range(n) if indeg[i] == 0])
-    layers, seen = [], set()
-    while q:
-        layer = list(q)
+    # Kahn layering, one frontier list per layer (if cycles, fall back to
+    # single layer)
+    layer = [i for i in range(n) if indeg[i] == 0]
+    layers, n_seen = [], 0
+    while layer:
         layers.append(layer)
-        q.clear()
+        n_seen += len(layer)
+        nxt = []
         for u in layer:
-            seen.add(u)
             for v,_ in out[u]:
                 indeg[v] -= 1
                 if indeg[v] == 0:
-                    q.append(v)
-    if len(seen) != n:
+                    nxt.append(v)
+        layer = nxt
+    if n_seen != n:
         layers = [list(range(n))]  # cycle present → one row
 
     # Render
@@ -83,7 +83,7 @@ def display_system_ascii(servers, P):
 def to_dot(servers, P):
     """Return Graphviz DOT string."""
     n = len(servers)
-    labels = {i: _server_label(servers[i], i) for i in range(n)}
+    labels = [_server_label(s, i) for i, s in enumerate(servers)]
     edges = _build_edges(servers, P)
 
     lines = [
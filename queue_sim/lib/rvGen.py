@@ -22,26 +22,42 @@ from typing import Callable
 # Generator functions (return Callable[[], float])
 # ---------------------------------------------------------------------------
 
+# The returned closures run once per event, so loop invariants are hoisted
+# and ``random.random`` / ``math.log1p`` are bound as closure locals to skip the
+# per-call global + attribute lookups.  Draws still come from the global
+# ``random`` state, so ``QueueSystem.sim(seed=...)`` stays reproducible.
+
 def genExp(mu: float) -> Callable[[], float]:
     """X ~ Exponential(mu), with E[X] = 1/mu."""
-    return lambda: -(1 / mu) * math.log(1 - random.random())
+    # 1 - u is exact for u >= 0.5, so there is no cancellation near 1; the
+    # gain is for u near 0, where log(1 - u) rounds away the low bits of u
+    # and log1p(-u) keeps them.  Those are the short draws, not the tail.
+    neg_scale = -(1 / mu)
+    rand = random.random
+    log1p = math.log1p
+    return lambda: neg_scale * log1p(-rand())
 
 
 def genUniform(a: float, b: float) -> Callable[[], float]:
     """X ~ Uniform(a, b)."""
     d = b - a
-    return lambda: d * random.random() + a
+    rand = random.random
+    return lambda: d * rand() + a
 
 
 def genBoundedPareto(k: float, p: float, alpha: float) -> Callable[[], float]:
     """X ~ BoundedPareto(k, p, alpha)."""
     C = (k ** alpha) / (1 - (k / p) ** alpha)
-    return lambda: (-random.random() / C + k ** (-alpha)) ** (-1 / alpha)
+    k_neg_alpha = k ** (-alpha)
+    neg_inv_alpha = -1 / alpha
+    rand = random.random
+    return lambda: (-rand() / C + k_neg_alpha) ** neg_inv_alpha
 
 
 def genBernoulli(p: float) -> Callable[[], int]:
     """X ~ Bernoulli(p), returns 0 or 1."""
-    return lambda: 1 if random.random() <= p else 0
+    rand = random.random
+    return lambda: 1 if rand() <= p else 0
 
 
 # ---------------------------------------------------------------------------
@@ -56,9 +72,10 @@ def Uniform(a: float, b: float) -> float:
 
 def BoundedPareto(k: float, p: float, alpha: float) -> float:
     """Return a single sample from BoundedPareto(k, p, alpha)."""
-    return genBoundedPareto(k, p, alpha)()
+    C = (k ** alpha) / (1 - (k / p) ** alpha)
+    return (-random.random() / C + k ** (-alpha)) ** (-1 / alpha)
 
 
 def Bernoulli(p: float) -> int:
     """Return a single sample from Bernoulli(p)."""
-    return genBernoulli(p)()
+    return 1 if random.random() <= p else 0
@@ -36,6 +36,18 @@ def _ensure_ax(ax, plt):
     return fig, ax
 
 
+def _ecdf(response_times):
+    """Return ``(sorted_rt, cdf)`` for the empirical CDF of *response_times*.
+
+    The input is viewed as contiguous float64 first (zero-copy for the
+    ``array('d')`` that ``sim()`` produces), so the sort runs on NumPy's
+    native float path instead of first converting from object/boxed values.
+    """
+    sorted_rt = np.sort(np.asarray(response_times, dtype=np.float64))
+    n = len(sorted_rt)
+    return sorted_rt, np.arange(1, n + 1, dtype=np.float64) / n
+
+
 def plot_cdf(
     response_times: Sequence[float],
     *,
@@ -57,9 +69,7 @@ def plot_cdf(
     plt = _import_matplotlib()
     fig, ax = _ensure_ax(ax, plt)
 
-    sorted_rt = np.sort(response_times)
-    n = len(sorted_rt)
-    cdf = np.arange(1, n + 1) / n
+    sorted_rt, cdf = _ecdf(response_times)
 
     ax.step(sorted_rt, cdf, where="post", label=label, **kwargs)
     ax.set_xlabel("Response time")
@@ -77,6 +87,7 @@ def plot_tail(
     ax: matplotlib.axes.Axes | None = None,
     label: str | None = None,
     log: bool = True,
+    threshold: float | None = None,
     **kwargs,
 ) -> tuple[matplotlib.figure.Figure, matplotlib.axes.Axes]:
     """Plot the empirical tail probability P(T > t).
@@ -86,17 +97,36 @@ def plot_tail(
         ax: Matplotlib axes to plot on. If None, a new figure is created.
         label: Legend label for this curve.
         log: If True (default), use log scale on the y-axis.
+        threshold: If given, plot only the largest ``threshold`` fraction
+            of the samples (e.g. ``0.01`` for the top 1%).  The rest of the
+            data is split off with a linear-time partition instead of being
+            fully sorted.
         **kwargs: Passed to ``ax.step()``.
 
     Returns:
         (fig, ax) tuple.
     """
+    if threshold is not None and not 0 < threshold <= 1:
+        raise ValueError(f"threshold must be in (0, 1], got {threshold!r}")
+
     plt = _import_matplotlib()
     fig, ax = _ensure_ax(ax, plt)
 
-    sorted_rt = np.sort(response_times)
-    n = len(sorted_rt)
-    tail = 1.0 - np.arange(1, n + 1) / n
+    if threshold is None:
+        sorted_rt, cdf = _ecdf(response_times)
+        tail = 1.0 - cdf
+    else:
+        rt = np.asarray(response_times, dtype=np.float64)
+        n = len(rt)
+        if n == 0:
+            # Nothing to partition; plot the same empty curve as threshold=None.
+            sorted_rt = tail = rt
+        else:
+            k = min(int(n * (1 - threshold)), n - 1)
+            # Only the top n - k order statistics are sorted; their ranks are
+            # k + 1 .. n, the same points the full-sort curve has there.
+            sorted_rt = np.sort(np.partition(rt, k)[k:])
+            tail = 1.0 - np.arange(k + 1, n + 1, dtype=np.float64) / n
 
     ax.step(sorted_rt, tail, where="post", label=label, **kwargs)
     ax.set_xlabel("Response time")
@@ -192,21 +222,18 @@ def plot_server_occupancy(
     Returns:
         (fig, ax) tuple.
     """
-    from .event_log import _bin_step_function, per_server_states
+    from .event_log import _bin_step_function, _server_state_arrays
 
     plt = _import_matplotlib()
     fig, ax = _ensure_ax(ax, plt)
 
-    data = per_server_states(log, n_servers=n_servers)
-    n_srv = len(data["server_states"])
-    times_arr = np.array(data["times"])
+    times_arr, server_states = _server_state_arrays(log, n_servers)
+    n_srv = len(server_states)
 
     t_max = times_arr[-1] if len(times_arr) > 0 else 1.0
     bin_edges = np.linspace(0, t_max, n_bins + 1)
 
-    grid = np.zeros((n_srv, n_bins))
-    for s in range(n_srv):
-        grid[s] = _bin_step_function(times_arr, data["server_states"][s], bin_edges)
+    grid = _bin_step_function(times_arr, server_states, bin_edges)
 
     mesh = ax.pcolormesh(
         bin_edges,
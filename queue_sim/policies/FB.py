@@ -14,18 +14,24 @@ from ..server import Server
 
 class FB(Server):
 
+    __slots__ = ("remaining", "attained", "jobArrivals", "__dict__")
+
     def __init__(
         self,
         sizefn: Callable[[], float],
         buffer_capacity: int | None = None,
     ) -> None:
         super().__init__(sizefn, 1, buffer_capacity)
-        # Each job: [remaining, attained, arrival_time]
-        self.jobs: list[list[float]] = []
+        # Parallel per-job columns (job i is index i in each).
+        self.remaining: list[float] = []
+        self.attained: list[float] = []
+        self.jobArrivals: list[float] = []
 
     def reset(self) -> None:
         super().reset()
-        self.jobs = []
+        self.remaining = []
+        self.attained = []
+        self.jobArrivals = []
 
     def nextJob(self) -> float:
         return self.genSize()
@@ -35,37 +41,42 @@ class FB(Server):
         return
 
     def arrival(self) -> None:
-        self.jobs.append([self.genSize(), 0.0, self.clock])
+        self.remaining.append(self.genSize())
+        self.attained.append(0.0)
+        self.jobArrivals.append(self.clock)
         self.state += 1
         self._recalc_ttnc()
 
     def update(self, time_elapsed: float) -> bool:
         self.TTNC -= time_elapsed
         self.clock += time_elapsed
-        if not self.jobs:
+        remaining = self.remaining
+        attained = self.attained
+        if not remaining:
             return False
 
         # Find active set (minimum attained service)
-        min_att = min(j[1] for j in self.jobs)
-        active = [i for i, j in enumerate(self.jobs) if j[1] <= min_att + 1e-12]
-        num_active = len(active)
+        level = min(attained) + 1e-12
+        active = [i for i, a in enumerate(attained) if a <= level]
 
-        work = time_elapsed / num_active
+        work = time_elapsed / len(active)
         for i in active:
-            self.jobs[i][0] -= work   # remaining
-            self.jobs[i][1] += work   # attained
+            remaining[i] -= work
+            attained[i] += work
 
         if self.TTNC <= 0.0:
             # Check for completion (remaining ≈ 0)
-            for i, j in enumerate(self.jobs):
-                if j[0] <= 1e-12:
-                    response_time = self.clock - j[2]
+            for i, r in enumerate(remaining):
+                if r <= 1e-12:
+                    response_time = self.clock - self.jobArrivals[i]
                     self._last_response_time = response_time
-                    del self.jobs[i]
+                    del remaining[i]
+                    del attained[i]
+                    del self.jobArrivals[i]
                     self.state -= 1
                     self.num_completions += 1
-                    n = self.num_completions
-                    self.T = self.T * (n - 1) / n + response_time / n
+                    self._sum_T += response_time
+                    self.T = self._sum_T / self.num_completions
                     self._recalc_ttnc()
                     return True
             # Level crossing — active set expanded, recalculate
@@ -73,21 +84,23 @@ class FB(Server):
         return False
 
     def _recalc_ttnc(self) -> None:
-        if not self.jobs:
+        if not self.remaining:
             self.TTNC = math.inf
             return
 
-        min_att = min(j[1] for j in self.jobs)
+        min_att = min(self.attained)
+        level = min_att + 1e-12
         min_rem_active = math.inf
         next_level = math.inf
         num_active = 0
 
-        for j in self.jobs:
-            if j[1] <= min_att + 1e-12:
+        for r, a in zip(self.remaining, self.attained):
+            if a <= level:
                 num_active += 1
-                min_rem_active = min(min_rem_active, j[0])
-            else:
-                next_level = min(next_level, j[1])
+                if r < min_rem_active:
+                    min_rem_active = r
+            elif a < next_level:
+                next_level = a
 
         time_to_completion = min_rem_active * num_active
         time_to_crossing = (next_level - min_att) * num_active
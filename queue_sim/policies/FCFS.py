@@ -14,6 +14,9 @@ from ..server import Server
 
 class FCFS(Server):
 
+    # __dict__ also backs the k=1 instance-level method bindings.
+    __slots__ = ("channelRemaining", "channelArrivals", "waitQueue", "__dict__")
+
     def __init__(
         self,
         sizefn: Callable[[], float],
@@ -24,6 +27,12 @@ class FCFS(Server):
         self.channelRemaining: list[float] = []
         self.channelArrivals: list[float] = []
         self.waitQueue: deque[float] = deque()
+        if num_servers == 1 and type(self) is FCFS:
+            # k=1 is exactly the base-class FIFO server: bind its methods on
+            # the instance so the sim loop skips the k>1 dispatch per event.
+            self.arrival = super().arrival
+            self.update = super().update
+            self.updateET = super().updateET
 
     def reset(self) -> None:
         super().reset()
@@ -70,8 +79,8 @@ class FCFS(Server):
             response_time = self.clock - self.channelArrivals[idx]
             self._last_response_time = response_time
             self.num_completions += 1
-            n = self.num_completions
-            self.T = self.T * (n - 1) / n + response_time / n
+            self._sum_T += response_time
+            self.T = self._sum_T / self.num_completions
 
             del self.channelRemaining[idx]
             del self.channelArrivals[idx]
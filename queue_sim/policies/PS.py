@@ -15,6 +15,8 @@ from ..server import Server
 
 class PS(Server):
 
+    __slots__ = ("finishTags", "jobArrivals", "_attained", "__dict__")
+
     def __init__(
         self,
         sizefn: Callable[[], float],
@@ -22,13 +24,20 @@ class PS(Server):
         buffer_capacity: int | None = None,
     ) -> None:
         super().__init__(sizefn, num_servers, buffer_capacity)
-        self.remaining: list[float] = []
+        # Every job in service receives the same work, so instead of
+        # decrementing each job's remaining size per event we track the
+        # work given to *every* job so far (``_attained``) and store each
+        # job's finish tag ``size + _attained-at-arrival``.  A job's
+        # remaining size is ``tag - _attained``; update() is then O(1).
+        self.finishTags: list[float] = []
         self.jobArrivals: list[float] = []
+        self._attained = 0.0
 
     def reset(self) -> None:
         super().reset()
-        self.remaining = []
+        self.finishTags = []
         self.jobArrivals = []
+        self._attained = 0.0
 
     def nextJob(self) -> float:
         return self.genSize()
@@ -38,7 +47,7 @@ class PS(Server):
         return
 
     def arrival(self) -> None:
-        self.remaining.append(self.genSize())
+        self.finishTags.append(self.genSize() + self._attained)
         self.jobArrivals.append(self.clock)
         self.state += 1
         self._recalc_ttnc()
@@ -49,29 +58,31 @@ class PS(Server):
         if self.state == 0:
             return False
 
-        work = time_elapsed * min(self.num_servers, self.state) / self.state
-        for i in range(len(self.remaining)):
-            self.remaining[i] -= work
+        self._attained += time_elapsed * min(self.num_servers, self.state) / self.state
 
         if self.TTNC <= 0.0:
-            idx = min(range(len(self.remaining)), key=lambda i: self.remaining[i])
+            tags = self.finishTags
+            idx = tags.index(min(tags))
             response_time = self.clock - self.jobArrivals[idx]
             self._last_response_time = response_time
-            del self.remaining[idx]
+            del tags[idx]
             del self.jobArrivals[idx]
             self.state -= 1
+            if not tags:
+                # Rebase while idle so the offset never grows unbounded.
+                self._attained = 0.0
             self.num_completions += 1
-            n = self.num_completions
-            self.T = self.T * (n - 1) / n + response_time / n
+            self._sum_T += response_time
+            self.T = self._sum_T / self.num_completions
             self._recalc_ttnc()
             return True
         return False
 
     def _recalc_ttnc(self) -> None:
-        if not self.remaining:
+        if not self.finishTags:
             self.TTNC = math.inf
             return
-        min_rem = min(self.remaining)
+        min_rem = min(self.finishTags) - self._attained
         self.TTNC = min_rem * self.state / min(self.num_servers, self.state)
 
 
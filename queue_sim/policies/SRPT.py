@@ -15,6 +15,8 @@ from ..server import Server
 
 class SRPT(Server):
 
+    __slots__ = ("jobs", "_running_arrival_time", "__dict__")
+
     def __init__(
         self,
         sizefn: Callable[[], float],
@@ -37,16 +39,23 @@ class SRPT(Server):
     def updateET(self) -> None:
         t = self.clock - self._running_arrival_time
         self._last_response_time = t
-        n = self.num_completions
-        self.T = self.T * (n - 1) / n + t / n
+        self._sum_T += t
+        self.T = self._sum_T / self.num_completions
 
     def arrival(self) -> None:
+        # The running job is never larger than anything in the heap (it was
+        # the minimum when started and has only shrunk since), so the job to
+        # run next is the smaller of it and the arrival: one heap push at
+        # most, instead of push + push + pop.
+        job = (self.genSize(), self.clock)
         if self.state > 0:
-            heapq.heappush(self.jobs, (self.TTNC, self._running_arrival_time))
-        heapq.heappush(self.jobs, (self.genSize(), self.clock))
-        remaining, arr = heapq.heappop(self.jobs)
-        self.TTNC = remaining
-        self._running_arrival_time = arr
+            running = (self.TTNC, self._running_arrival_time)
+            if running <= job:
+                heapq.heappush(self.jobs, job)
+                self.state += 1
+                return
+            heapq.heappush(self.jobs, running)
+        self.TTNC, self._running_arrival_time = job
         self.state += 1
 
     # Critical ordering: updateET() BEFORE nextJob()
@@ -9,7 +9,14 @@ nearest event. This allows the simulation to skip idle time rather than
 stepping in real-time increments.
 """
 
+import math
+import multiprocessing
+import os
 import random
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
 from typing import Callable
 
 from .results import ReplicationResult, _build_replication_result, _derive_seed
@@ -27,6 +34,7 @@ class QueueSystem:
         self.servers = servers
         self.genArrival = arrivalfn
         self.transitionMatrix = transitionMatrix or []
+        self._cum_rows: list[list[float]] = []
         self.T: float = 0.0
 
     # -- configuration helpers ------------------------------------------------
@@ -58,27 +66,18 @@ class QueueSystem:
                     f"Transition matrix row {i} sums to {sum(row)}, expected 1.0"
                 )
 
+    def _build_routing_table(self) -> None:
+        """Cache each transition-matrix row as a cumulative distribution."""
+        self._cum_rows = [list(accumulate(row)) for row in self.transitionMatrix]
+
     def _min_ttnc(self) -> float:
         """Return the minimum time-to-next-completion across all servers."""
-        return min(s.queryTTNC() for s in self.servers)
-
-    def _route_job(self, server_idx: int) -> int:
-        """Return the index of the next server for a completed job.
-
-        If the returned index == len(self.servers), the job exits the system.
-        For deterministic (tandem) routing, jobs proceed to server_idx + 1.
-        """
-        if not self.transitionMatrix:
-            return server_idx + 1
-
-        u = random.random()
-        acc = 0.0
-        for i, p in enumerate(self.transitionMatrix[server_idx]):
-            acc += p
-            if u < acc:
-                return i
-        # Numerical safety: if we fall through, treat as exit
-        return len(self.servers)
+        servers = self.servers
+        if len(servers) == 1:
+            return servers[0].queryTTNC()
+        # A list comprehension is cheaper than feeding min() a generator at
+        # the handful of servers a network typically has.
+        return min([s.queryTTNC() for s in servers])
 
     # -- main simulation loop -------------------------------------------------
 
@@ -99,7 +98,9 @@ class QueueSystem:
             seed:       Optional RNG seed for reproducibility.
             _warmup:    Number of departures to discard before measurement.
             track_response_times: If True, record every job's response time
-                        in ``self.response_times`` (list of floats).
+                        in ``self.response_times`` (an ``array('d')``;
+                        stored unboxed, and ``np.asarray`` wraps it
+                        without copying).
             track_events: If True, record every event during the measurement
                         phase in ``self.event_log`` (:class:`EventLog`).
 
@@ -110,119 +111,189 @@ class QueueSystem:
             random.seed(seed)
 
         self._verify_transition_matrix()
+        self._build_routing_table()
         for server in self.servers:
             server.reset()
 
-        num_completions = 0
-        ttna = self.genArrival()       # time to next arrival
+        if (len(self.servers) == 1 and not self.transitionMatrix
+                and not track_response_times and not track_events):
+            return self._sim_single_server(num_events, _warmup)
+
+        # Loop invariants bound once; both phases run once per event.
+        servers = self.servers
+        n_servers = len(servers)
+        entry = servers[0]
+        # Pre-bound update methods, so each per-event call skips the
+        # attribute lookup on the server.
+        updates = [server.update for server in servers]
+        indexed_updates = list(enumerate(updates))
+        # One list reused for every event's completions (cleared, not rebuilt)
+        completed: list[int] = []
+        mark_completed = completed.append
+        min_ttnc = self._min_ttnc
+        gen_arrival = self.genArrival
+        # Routing: tandem (idx + 1) when there is no matrix, else the first
+        # destination whose cumulative probability exceeds u, capped at exit
+        # in case a row sums to just under 1.
+        cum_rows = self._cum_rows if self.transitionMatrix else None
+        rand = random.random
+        inf = math.inf
+
+        if track_response_times:
+            self.response_times: array = array("d")
+            record_rt = self.response_times.append
+
+        if track_events:
+            from .event_log import EventLog
+
+            self.event_log = EventLog()
+            record_event = self.event_log._append
+            ARRIVAL, DEPARTURE = EventLog.ARRIVAL, EventLog.DEPARTURE
+            ROUTE, REJECTION = EventLog.ROUTE, EventLog.REJECTION
+            EXTERNAL, SYSTEM_EXIT = EventLog.EXTERNAL, EventLog.SYSTEM_EXIT
+
+        ttna = gen_arrival()           # time to next arrival
         state = 0                      # total jobs in the network
 
-        # -- warmup phase (no accumulation) -----------------------------------
-        if _warmup > 0:
-            warmup_done = 0
-            while warmup_done < _warmup:
-                ttnc = self._min_ttnc()
+        # One event loop runs both phases: warmup (statistics discarded,
+        # nothing tracked), then measurement.  The phase only changes which
+        # flags are on, so there is no per-event phase check.
+        for target_completions, measuring in ((_warmup, False), (num_events, True)):
+            if measuring:
+                # Clear per-server rejection counters so measurement
+                # reflects only the measurement phase.
+                for server in servers:
+                    server.num_rejected = 0
+                    server.num_arrivals = 0
+            log_rt = measuring and track_response_times
+            log_events = measuring and track_events
+
+            num_completions = 0
+            area_n: float = 0.0
+            clock: float = 0.0
+
+            while num_completions < target_completions:
+                # An empty network has every server idle (TTNC = inf), so
+                # the scan can be skipped.
+                ttnc = min_ttnc() if state else inf
                 ttne = min(ttnc, ttna)
-                completed = [
-                    idx for idx, server in enumerate(self.servers)
-                    if server.update(ttne)
-                ]
-                for idx in completed:
-                    dest = self._route_job(idx)
-                    if dest >= len(self.servers):
-                        warmup_done += 1
-                        state -= 1
-                    else:
-                        self.servers[dest].num_arrivals += 1
-                        if self.servers[dest].is_full():
-                            self.servers[dest].num_rejected += 1
-                            warmup_done += 1
+
+                clock += ttne
+                area_n += state * ttne
+
+                if ttna < ttnc:
+                    # Pure arrival tick: every server is strictly short of its
+                    # next completion, so just advance them -- nothing can
+                    # complete and there is nothing to route.
+                    for update in updates:
+                        update(ttne)
+                else:
+                    # Advance all servers, collect indices of those that completed
+                    completed.clear()
+                    for idx, update in indexed_updates:
+                        if update(ttne):
+                            mark_completed(idx)
+
+                    # Route completed jobs
+                    for idx in completed:
+                        if cum_rows is None:
+                            dest = idx + 1
+                        else:
+                            dest = min(bisect_right(cum_rows[idx], rand()), n_servers)
+                        if dest >= n_servers:
+                            num_completions += 1
                             state -= 1
+                            if log_rt:
+                                record_rt(servers[idx]._last_response_time)
+                            if log_events:
+                                record_event(clock, DEPARTURE, idx, SYSTEM_EXIT, state)
                         else:
-                            self.servers[dest].arrival()
+                            target = servers[dest]
+                            target.num_arrivals += 1
+                            if target.is_full():
+                                target.num_rejected += 1
+                                num_completions += 1
+                                state -= 1
+                                if log_events:
+                                    record_event(clock, REJECTION, idx, dest, state)
+                            else:
+                                target.arrival()
+                                if log_events:
+                                    record_event(clock, ROUTE, idx, dest, state)
+
+                # Handle arrival if it fires at or before the next completion
                 if ttna <= ttnc:
-                    self.servers[0].num_arrivals += 1
-                    if self.servers[0].is_full():
-                        self.servers[0].num_rejected += 1
+                    entry.num_arrivals += 1
+                    if entry.is_full():
+                        entry.num_rejected += 1
+                        if log_events:
+                            record_event(clock, REJECTION, EXTERNAL, 0, state)
                     else:
                         state += 1
-                        self.servers[0].arrival()
-                    ttna = self.genArrival()
+                        entry.arrival()
+                        if log_events:
+                            record_event(clock, ARRIVAL, EXTERNAL, 0, state)
+                    ttna = gen_arrival()
                 else:
                     ttna -= ttne
 
-        # Clear per-server rejection counters so measurement reflects
-        # only the measurement phase.
-        for server in self.servers:
-            server.num_rejected = 0
-            server.num_arrivals = 0
-
-        # -- measurement phase ------------------------------------------------
-        if track_response_times:
-            self.response_times: list[float] = []
-
-        if track_events:
-            from .event_log import EventLog
-
-            self.event_log = EventLog()
-            log = self.event_log
-
-        area_n: float = 0.0
-        clock: float = 0.0
-
-        while num_completions < num_events:
-            ttnc = self._min_ttnc()
-            ttne = min(ttnc, ttna)
+        mean_n = area_n / clock
+        mean_t = area_n / max(1, num_completions)
+        self.T = mean_t
+        return (mean_n, mean_t)
 
-            clock += ttne
-            area_n += state * ttne
+    def _sim_single_server(self, num_events: int, warmup: int) -> tuple[float, float]:
+        """Specialized :meth:`sim` loop for one server with no tracking.
 
-            # Advance all servers, collect indices of those that completed
-            completed = [
-                idx for idx, server in enumerate(self.servers)
-                if server.update(ttne)
-            ]
-
-            # Route completed jobs
-            for idx in completed:
-                dest = self._route_job(idx)
-                if dest >= len(self.servers):
-                    num_completions += 1
-                    state -= 1
-                    if track_response_times:
-                        self.response_times.append(
-                            self.servers[idx]._last_response_time
-                        )
-                    if track_events:
-                        log._append(clock, EventLog.DEPARTURE, idx, EventLog.SYSTEM_EXIT, state)
+        With a single server and no transition matrix every completion
+        leaves the system, so the routing pass, the ``completed`` list and
+        the tracking branches all drop out.  Events are processed in the
+        same order as the general loop, so results are bit-for-bit the same.
+        """
+        server = self.servers[0]
+        query_ttnc = server.queryTTNC
+        update = server.update
+        arrival = server.arrival
+        is_full = server.is_full
+        gen_arrival = self.genArrival
+        inf = math.inf
+
+        ttna = gen_arrival()
+        state = 0
+
+        # Warmup then measurement, as in sim()'s general loop.
+        for target_completions, measuring in ((warmup, False), (num_events, True)):
+            if measuring:
+                server.num_rejected = 0
+                server.num_arrivals = 0
+
+            num_completions = 0
+            area_n = 0.0
+            clock = 0.0
+
+            while num_completions < target_completions:
+                ttnc = query_ttnc() if state else inf
+                if ttna < ttnc:
+                    # arrival tick
+                    clock += ttna
+                    area_n += state * ttna
+                    update(ttna)
                 else:
-                    self.servers[dest].num_arrivals += 1
-                    if self.servers[dest].is_full():
-                        self.servers[dest].num_rejected += 1
+                    clock += ttnc
+                    area_n += state * ttnc
+                    if update(ttnc):
                         num_completions += 1
                         state -= 1
-                        if track_events:
-                            log._append(clock, EventLog.REJECTION, idx, dest, state)
-                    else:
-                        self.servers[dest].arrival()
-                        if track_events:
-                            log._append(clock, EventLog.ROUTE, idx, dest, state)
-
-            # Handle arrival if it fires at or before the next completion
-            if ttna <= ttnc:
-                self.servers[0].num_arrivals += 1
-                if self.servers[0].is_full():
-                    self.servers[0].num_rejected += 1
-                    if track_events:
-                        log._append(clock, EventLog.REJECTION, EventLog.EXTERNAL, 0, state)
+                    if ttna > ttnc:
+                        ttna -= ttnc
+                        continue
+                server.num_arrivals += 1
+                if is_full():
+                    server.num_rejected += 1
                 else:
                     state += 1
-                    self.servers[0].arrival()
-                    if track_events:
-                        log._append(clock, EventLog.ARRIVAL, EventLog.EXTERNAL, 0, state)
-                ttna = self.genArrival()
-            else:
-                ttna -= ttne
+                    arrival()
+                ttna = gen_arrival()
 
         mean_n = area_n / clock
         mean_t = area_n / max(1, num_completions)
@@ -239,15 +310,25 @@ class QueueSystem:
         seed: int | None = None,
         confidence: float = 0.95,
         warmup: int = 0,
+        n_workers: int = 1,
     ) -> ReplicationResult:
         """Run multiple independent replications and return a CI.
 
+        With one worker (or where ``fork`` is unavailable) the replications
+        run in this process, so afterwards the system and the global
+        ``random`` state are left as the last replication's :meth:`sim`
+        call left them.  With worker processes every run happens in a forked
+        copy and this system (``T``, server counters, ...) is not modified.
+
         Args:
             n_replications: Number of independent runs (>= 2).
             num_events:     Departures per replication.
             seed:           Base seed (deterministic seed derivation per rep).
             confidence:     Confidence level in (0, 1).
             warmup:         Warmup departures discarded per replication.
+            n_workers:      Worker processes (0 = ``os.cpu_count()``). Results
+                            are identical for any value, since every
+                            replication is seeded independently.
 
         Returns:
             :class:`ReplicationResult` with grand means and CIs.
@@ -256,20 +337,53 @@ class QueueSystem:
             raise ValueError("n_replications must be >= 2")
         if not (0 < confidence < 1):
             raise ValueError("confidence must be in (0, 1)")
+        if n_workers < 0:
+            raise ValueError("n_workers must be >= 0")
 
         base_seed = seed if seed is not None else random.randrange(2**63)
+        rep_seeds = [_derive_seed(base_seed, i) for i in range(n_replications)]
+
+        if n_workers == 0:
+            n_workers = os.cpu_count() or 1
+        n_workers = min(n_workers, n_replications)
+
+        # Worker processes sidestep the GIL.  Distributions are arbitrary
+        # callables (usually lambdas) and can't be pickled, so the system is
+        # handed to the workers by forking; without fork we run serially.
+        if n_workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+                initargs=(self,),
+            ) as pool:
+                results = list(pool.map(
+                    _run_replication,
+                    rep_seeds,
+                    [num_events] * n_replications,
+                    [warmup] * n_replications,
+                ))
+        else:
+            results = [
+                self.sim(num_events=num_events, seed=s, _warmup=warmup)
+                for s in rep_seeds
+            ]
+
+        raw_N = tuple(n for n, _ in results)
+        raw_T = tuple(t for _, t in results)
+        return _build_replication_result(raw_N, raw_T, confidence)
+
+
+_worker_system: QueueSystem | None = None
+
+
+def _init_worker(system: QueueSystem) -> None:
+    global _worker_system
+    _worker_system = system
+
 
-        raw_N: list[float] = []
-        raw_T: list[float] = []
-        for i in range(n_replications):
-            rep_seed = _derive_seed(base_seed, i)
-            n, t = self.sim(num_events=num_events, seed=rep_seed, _warmup=warmup)
-            raw_N.append(n)
-            raw_T.append(t)
-
-        return _build_replication_result(
-            tuple(raw_N), tuple(raw_T), confidence,
-        )
+def _run_replication(seed: int, num_events: int, warmup: int) -> tuple[float, float]:
+    return _worker_system.sim(num_events=num_events, seed=seed, _warmup=warmup)
 
 
 __all__ = ['QueueSystem']
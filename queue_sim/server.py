@@ -15,6 +15,16 @@ from typing import Callable
 
 class Server(ABC):
 
+    # Fixed attribute layout: the event loop reads and writes these on every
+    # event.  Subclasses without their own ``__slots__`` still get a
+    # ``__dict__`` for any extra state; the built-in policies list it
+    # explicitly so user attributes such as ``name`` keep working.
+    __slots__ = (
+        "genSize", "num_servers", "buffer_capacity",
+        "clock", "arrivalTimes", "TTNC", "T", "_sum_T", "num_completions",
+        "state", "num_rejected", "num_arrivals", "_last_response_time",
+    )
+
     def __init__(
         self,
         sizefn: Callable[[], float],
@@ -34,6 +44,7 @@ class Server(ABC):
         self.arrivalTimes: deque[float] = deque()
         self.TTNC: float = math.inf
         self.T: float = 0.0
+        self._sum_T: float = 0.0    # running sum of response times; T = sum / n
         self.num_completions: int = 0
         self.state: int = 0
         self.num_rejected: int = 0
@@ -54,15 +65,15 @@ class Server(ABC):
         ...
 
     def updateET(self) -> None:
-        """Update running mean response time E[T] via incremental average.
+        """Update running mean response time E[T] from the running sum.
 
         Only valid for FIFO-ordered policies. Policies that reorder jobs
         (e.g. SRPT) should override this.
         """
         t = self.clock - self.arrivalTimes.popleft()
         self._last_response_time = t
-        n = self.num_completions
-        self.T = self.T * (n - 1) / n + t / n
+        self._sum_T += t
+        self.T = self._sum_T / self.num_completions
 
     def arrival(self) -> None:
         """Register a new job arrival at this server."""
@@ -80,9 +91,10 @@ class Server(ABC):
 
         Returns True if a job completed during this time step.
         """
-        self.TTNC -= time_elapsed
+        ttnc = self.TTNC - time_elapsed
+        self.TTNC = ttnc
         self.clock += time_elapsed
-        if self.TTNC <= 0.0:
+        if ttnc <= 0.0:
             self.state -= 1
             self.TTNC = self.nextJob() if self.state > 0 else math.inf
             self.num_completions += 1
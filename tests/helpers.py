@@ -1,7 +1,5 @@
 """Shared analytical helpers for queueing tests."""
 
-from math import factorial
-
 
 def erlang_b(c: int, a: float) -> float:
     """Erlang-B formula: blocking probability for M/M/c/c (loss system).
@@ -47,9 +45,15 @@ def erlang_c(k: int, a: float) -> float:
         P(wait) — the probability a customer must queue.
     """
     rho = a / k
-    num = a**k / (factorial(k) * (1 - rho))
-    denom = sum(a**n / factorial(n) for n in range(k)) + num
-    return num / denom
+    # Build each a**n / n! from the previous term instead of recomputing
+    # the power and factorial for every n.
+    term = 1.0
+    partial = 0.0
+    for n in range(k):
+        partial += term
+        term *= a / (n + 1)
+    num = term / (1 - rho)
+    return num / (partial + num)
 
 
 def mmk_expected_T(lam: float, mu: float, k: int) -> float:
@@ -8,7 +8,7 @@ matplotlib.use("Agg")  # non-interactive backend for CI
 import matplotlib.animation  # noqa: E402
 
 from queue_sim import FCFS, QueueSystem, genExp  # noqa: E402
-from queue_sim.animate import animate_network  # noqa: E402
+from queue_sim.animate import _exit_servers, _infer_edges, animate_network  # noqa: E402
 
 NUM_EVENTS = 5_000
 
@@ -67,3 +67,13 @@ class TestAnimateNetwork:
             single_server_log, n_frames=10, title="M/M/1 Queue"
         )
         assert isinstance(anim, matplotlib.animation.FuncAnimation)
+
+
+class TestLogScans:
+    def test_tandem_edges(self, tandem_log):
+        assert _infer_edges(tandem_log) == {(0, 1)}
+        assert _exit_servers(tandem_log) == {1}
+
+    def test_single_server_has_no_edges(self, single_server_log):
+        assert _infer_edges(single_server_log) == set()
+        assert _exit_servers(single_server_log) == {0}
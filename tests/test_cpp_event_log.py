@@ -1,5 +1,7 @@
 """Tests for event log tracking (C++ backend)."""
 
+import operator
+
 import pytest
 
 _queue_sim_cpp = pytest.importorskip("_queue_sim_cpp")
@@ -28,13 +30,27 @@ def _make_tandem():
     )
 
 
+@pytest.fixture(scope="module")
+def fcfs_log():
+    """Log of one M/M/1-FCFS run (lam=1, mu=2), shared by the read-only checks."""
+    system = _make_system(_queue_sim_cpp.FCFS)
+    system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
+    return system.event_log
+
+
+@pytest.fixture(scope="module")
+def tandem_log():
+    """Log of one 2-server FCFS tandem run (lam=1, mu=3 at each server)."""
+    system = _make_tandem()
+    system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
+    return system.event_log
+
+
 class TestEventLogLength:
     """Events are logged when track_events=True."""
 
-    def test_events_logged(self):
-        system = _make_system(_queue_sim_cpp.FCFS)
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        assert len(system.event_log) > 0
+    def test_events_logged(self, fcfs_log):
+        assert len(fcfs_log) > 0
 
 
 class TestDefaultEmpty:
@@ -49,42 +65,35 @@ class TestDefaultEmpty:
 class TestAllKindsValid:
     """Every logged kind is one of the 4 constants."""
 
-    def test_kinds_valid(self):
-        system = _make_system(_queue_sim_cpp.FCFS)
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        assert all(k in VALID_KINDS for k in system.event_log.kinds)
+    def test_kinds_valid(self, fcfs_log):
+        assert all(k in VALID_KINDS for k in fcfs_log.kinds)
 
 
 class TestTimesNonDecreasing:
     """Event times must be monotonically non-decreasing."""
 
-    def test_non_decreasing(self):
-        system = _make_system(_queue_sim_cpp.FCFS)
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        times = system.event_log.times
-        assert all(a <= b for a, b in zip(times, times[1:]))
+    def test_non_decreasing(self, fcfs_log):
+        times = fcfs_log.times
+        assert list(times) == sorted(times)
 
 
 class TestDepartureCount:
     """Single-server no-buffer: departures == num_events."""
 
-    def test_departure_count(self):
-        system = _make_system(_queue_sim_cpp.FCFS)
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
-        departures = sum(1 for k in log.kinds if k == EventLog.DEPARTURE)
+    def test_departure_count(self, fcfs_log):
+        log = fcfs_log
+        departures = log.kinds.count(EventLog.DEPARTURE)
         assert departures == NUM_EVENTS
 
 
 class TestArrivalCount:
     """Single-server no-buffer: arrivals - departures == final state."""
 
-    def test_arrival_departure_balance(self):
-        system = _make_system(_queue_sim_cpp.FCFS)
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
-        arrivals = sum(1 for k in log.kinds if k == EventLog.ARRIVAL)
-        departures = sum(1 for k in log.kinds if k == EventLog.DEPARTURE)
+    def test_arrival_departure_balance(self, fcfs_log):
+        log = fcfs_log
+        kinds = log.kinds
+        arrivals = kinds.count(EventLog.ARRIVAL)
+        departures = kinds.count(EventLog.DEPARTURE)
         assert arrivals >= departures
         assert arrivals - departures == log.states[-1]
 
@@ -92,24 +101,20 @@ class TestArrivalCount:
 class TestStateAlwaysNonNegative:
     """System state is never negative."""
 
-    def test_state_non_negative(self):
-        system = _make_system(_queue_sim_cpp.FCFS)
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        assert all(s >= 0 for s in system.event_log.states)
+    def test_state_non_negative(self, fcfs_log):
+        assert min(fcfs_log.states) >= 0
 
 
 class TestFromToConsistency:
     """Departures have to==SYSTEM_EXIT, arrivals have from==EXTERNAL."""
 
-    def test_departure_to(self):
-        system = _make_system(_queue_sim_cpp.FCFS)
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
-        for i, k in enumerate(log.kinds):
-            if k == EventLog.DEPARTURE:
-                assert log.to_servers[i] == EventLog.SYSTEM_EXIT
-            if k == EventLog.ARRIVAL:
-                assert log.from_servers[i] == EventLog.EXTERNAL
+    def test_departure_to(self, fcfs_log):
+        log = fcfs_log
+        events = list(zip(log.kinds, log.from_servers, log.to_servers))
+        exits = {to for k, _fr, to in events if k == EventLog.DEPARTURE}
+        sources = {fr for k, fr, _to in events if k == EventLog.ARRIVAL}
+        assert exits == {EventLog.SYSTEM_EXIT}
+        assert sources == {EventLog.EXTERNAL}
 
 
 class TestBufferRejection:
@@ -124,19 +129,18 @@ class TestBufferRejection:
         )
         system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
         log = system.event_log
-        rejections = sum(1 for k in log.kinds if k == EventLog.REJECTION)
+        rejections = log.kinds.count(EventLog.REJECTION)
         assert rejections > 0
 
 
 class TestNetworkRouting:
     """2-server tandem: ROUTE events appear with correct from/to."""
 
-    def test_route_events(self):
-        system = _make_tandem()
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
-        routes = [(log.from_servers[i], log.to_servers[i])
-                  for i, k in enumerate(log.kinds) if k == EventLog.ROUTE]
+    def test_route_events(self, tandem_log):
+        log = tandem_log
+        routes = [(fr, to)
+                  for k, fr, to in zip(log.kinds, log.from_servers, log.to_servers)
+                  if k == EventLog.ROUTE]
         assert len(routes) > 0
         for from_s, to_s in routes:
             assert from_s == 0
@@ -178,10 +182,8 @@ class TestBackwardCompat:
 class TestParallelVectorsSameLength:
     """All 5 vectors have equal length."""
 
-    def test_same_length(self):
-        system = _make_system(_queue_sim_cpp.FCFS)
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
+    def test_same_length(self, fcfs_log):
+        log = fcfs_log
         n = len(log)
         assert len(log.times) == n
         assert len(log.kinds) == n
@@ -190,29 +192,50 @@ class TestParallelVectorsSameLength:
         assert len(log.states) == n
 
 
+@pytest.fixture(scope="class", params=[
+    _queue_sim_cpp.FCFS, _queue_sim_cpp.PS,
+    _queue_sim_cpp.FB, _queue_sim_cpp.SRPT,
+])
+def policy_log(request):
+    """Log of one M/M/1 run (lam=1, mu=2) per policy, shared within the class."""
+    system = _make_system(request.param)
+    system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
+    return system.event_log
+
+
 class TestAllPolicies:
     """Event logging works with all scheduling policies."""
 
-    @pytest.mark.parametrize("policy_cls", [
-        _queue_sim_cpp.FCFS, _queue_sim_cpp.PS,
-        _queue_sim_cpp.FB, _queue_sim_cpp.SRPT,
-    ])
-    def test_policy(self, policy_cls):
-        system = _make_system(policy_cls)
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
-        assert len(log) > 0
-        assert all(k in VALID_KINDS for k in log.kinds)
+    def test_policy(self, policy_log):
+        assert len(policy_log) > 0
+        assert all(k in VALID_KINDS for k in policy_log.kinds)
+
+    def test_times_non_decreasing(self, policy_log):
+        times = policy_log.times
+        assert list(times) == sorted(times)
+
+    def test_state_non_negative(self, policy_log):
+        assert min(policy_log.states) >= 0
+
+    def test_departure_count(self, policy_log):
+        departures = policy_log.kinds.count(EventLog.DEPARTURE)
+        assert departures == NUM_EVENTS
 
 
 class TestConstants:
     """Constants are accessible on the C++ EventLog class."""
 
     def test_kind_constants(self):
-        assert EventLog.ARRIVAL == "arrival"
-        assert EventLog.DEPARTURE == "departure"
-        assert EventLog.ROUTE == "route"
-        assert EventLog.REJECTION == "rejection"
+        assert EventLog.ARRIVAL == 0
+        assert EventLog.DEPARTURE == 1
+        assert EventLog.ROUTE == 2
+        assert EventLog.REJECTION == 3
+
+    def test_kind_names(self):
+        assert EventLog.KIND_NAMES[EventLog.ARRIVAL] == "arrival"
+        assert EventLog.KIND_NAMES[EventLog.DEPARTURE] == "departure"
+        assert EventLog.KIND_NAMES[EventLog.ROUTE] == "route"
+        assert EventLog.KIND_NAMES[EventLog.REJECTION] == "rejection"
 
     def test_server_constants(self):
         assert EventLog.EXTERNAL == -1
@@ -222,33 +245,25 @@ class TestConstants:
 class TestPerServerStates:
     """Tests for per_server_states() with C++ EventLog."""
 
-    def test_single_server_matches_system_state(self):
-        system = _make_system(_queue_sim_cpp.FCFS)
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
+    def test_single_server_matches_system_state(self, fcfs_log):
+        log = fcfs_log
         data = per_server_states(log)
         assert data["server_states"][0] == list(log.states)
 
-    def test_tandem_sum_equals_system_state(self):
-        system = _make_tandem()
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
+    def test_tandem_sum_equals_system_state(self, tandem_log):
+        log = tandem_log
         data = per_server_states(log)
-        for i in range(len(log)):
-            total = sum(data["server_states"][s][i] for s in range(2))
-            assert total == log.states[i]
+        s0, s1 = data["server_states"]
+        assert len(s0) == len(s1) == len(log)
+        assert list(map(operator.add, s0, s1)) == list(log.states)
 
-    def test_all_pops_non_negative(self):
-        system = _make_system(_queue_sim_cpp.FCFS)
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        data = per_server_states(system.event_log)
+    def test_all_pops_non_negative(self, fcfs_log):
+        data = per_server_states(fcfs_log)
         for s_states in data["server_states"]:
-            assert all(v >= 0 for v in s_states)
+            assert min(s_states) >= 0
 
-    def test_n_servers_inferred(self):
-        system = _make_tandem()
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        data = per_server_states(system.event_log)
+    def test_n_servers_inferred(self, tandem_log):
+        data = per_server_states(tandem_log)
         assert len(data["server_states"]) == 2
 
     def test_empty_log_raises(self):
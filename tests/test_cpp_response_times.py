@@ -6,7 +6,8 @@ import pytest
 
 _queue_sim_cpp = pytest.importorskip("_queue_sim_cpp")
 
-NUM_EVENTS = 100_000
+NUM_EVENTS = 100_000  # runs whose mean is checked against RTOL
+NUM_EVENTS_SMOKE = 5_000  # length / positivity / identity checks
 RTOL = 0.05  # 5% relative tolerance
 
 
@@ -18,45 +19,45 @@ def _make_system(policy_cls, **kwargs):
     )
 
 
+@pytest.fixture(scope="module", params=[
+    _queue_sim_cpp.FCFS, _queue_sim_cpp.PS,
+    _queue_sim_cpp.FB, _queue_sim_cpp.SRPT,
+])
+def tracked_run(request):
+    """One tracked M/M/1 run per policy, shared by the checks below.
+
+    Returns ``(response_times, T)``; ``response_times`` is fetched once
+    since each attribute access copies the C++ vector.
+    """
+    system = _make_system(request.param)
+    _N, T = system.sim(
+        num_events=NUM_EVENTS, seed=42, track_response_times=True
+    )
+    return system.response_times, T
+
+
 class TestResponseTimesLength:
     """len(response_times) == num_events for every policy."""
 
-    @pytest.mark.parametrize("policy_cls", [
-        _queue_sim_cpp.FCFS, _queue_sim_cpp.PS,
-        _queue_sim_cpp.FB, _queue_sim_cpp.SRPT,
-    ])
-    def test_length_matches_num_events(self, policy_cls):
-        system = _make_system(policy_cls)
-        system.sim(num_events=NUM_EVENTS, seed=42, track_response_times=True)
-        assert len(system.response_times) == NUM_EVENTS
+    def test_length_matches_num_events(self, tracked_run):
+        response_times, _T = tracked_run
+        assert len(response_times) == NUM_EVENTS
 
 
 class TestResponseTimesPositive:
     """All response times must be positive."""
 
-    @pytest.mark.parametrize("policy_cls", [
-        _queue_sim_cpp.FCFS, _queue_sim_cpp.PS,
-        _queue_sim_cpp.FB, _queue_sim_cpp.SRPT,
-    ])
-    def test_all_positive(self, policy_cls):
-        system = _make_system(policy_cls)
-        system.sim(num_events=NUM_EVENTS, seed=42, track_response_times=True)
-        assert all(t > 0 for t in system.response_times)
+    def test_all_positive(self, tracked_run):
+        response_times, _T = tracked_run
+        assert min(response_times) > 0
 
 
 class TestResponseTimesMeanMatchesET:
     """mean(response_times) ≈ system E[T] within tolerance."""
 
-    @pytest.mark.parametrize("policy_cls", [
-        _queue_sim_cpp.FCFS, _queue_sim_cpp.PS,
-        _queue_sim_cpp.FB, _queue_sim_cpp.SRPT,
-    ])
-    def test_mean_approx_ET(self, policy_cls):
-        system = _make_system(policy_cls)
-        _N, T = system.sim(
-            num_events=NUM_EVENTS, seed=42, track_response_times=True
-        )
-        mean_rt = statistics.mean(system.response_times)
+    def test_mean_approx_ET(self, tracked_run):
+        response_times, T = tracked_run
+        mean_rt = statistics.fmean(response_times)
         assert mean_rt == pytest.approx(T, rel=RTOL)
 
 
@@ -68,7 +69,7 @@ class TestSRPTNowReportsT:
         system = _queue_sim_cpp.QueueSystem(
             [server], _queue_sim_cpp.ExponentialDist(1.0)
         )
-        system.sim(num_events=NUM_EVENTS, seed=42)
+        system.sim(num_events=NUM_EVENTS_SMOKE, seed=42)
         assert server.T > 0
 
 
@@ -103,9 +104,9 @@ class TestWithBufferCapacity:
         system = _queue_sim_cpp.QueueSystem(
             [server], _queue_sim_cpp.ExponentialDist(1.0)
         )
-        system.sim(num_events=NUM_EVENTS, seed=42, track_response_times=True)
-        assert len(system.response_times) == NUM_EVENTS
-        assert all(t > 0 for t in system.response_times)
+        system.sim(num_events=NUM_EVENTS_SMOKE, seed=42, track_response_times=True)
+        assert len(system.response_times) == NUM_EVENTS_SMOKE
+        assert min(system.response_times) > 0
 
 
 class TestMultiServer:
@@ -123,8 +124,8 @@ class TestMultiServer:
             num_events=NUM_EVENTS, seed=42, track_response_times=True
         )
         assert len(system.response_times) == NUM_EVENTS
-        assert all(t > 0 for t in system.response_times)
-        mean_rt = statistics.mean(system.response_times)
+        assert min(system.response_times) > 0
+        mean_rt = statistics.fmean(system.response_times)
         assert mean_rt == pytest.approx(T, rel=RTOL)
 
 
@@ -134,11 +135,11 @@ class TestDeterminism:
     def test_tracking_does_not_change_results(self):
         """E[N], E[T] identical whether tracking is on or off."""
         system1 = _make_system(_queue_sim_cpp.FCFS)
-        N1, T1 = system1.sim(num_events=NUM_EVENTS, seed=42)
+        N1, T1 = system1.sim(num_events=NUM_EVENTS_SMOKE, seed=42)
 
         system2 = _make_system(_queue_sim_cpp.FCFS)
         N2, T2 = system2.sim(
-            num_events=NUM_EVENTS, seed=42, track_response_times=True
+            num_events=NUM_EVENTS_SMOKE, seed=42, track_response_times=True
         )
 
         assert N1 == N2
@@ -152,4 +153,4 @@ class TestDeterminism:
         system2 = _make_system(_queue_sim_cpp.FCFS)
         system2.sim(num_events=1000, seed=42, track_response_times=True)
 
-        assert list(system1.response_times) == list(system2.response_times)
+        assert system1.response_times == system2.response_times
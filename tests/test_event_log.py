@@ -1,5 +1,8 @@
 """Tests for event log tracking (Python backend)."""
 
+import operator
+import sys
+
 import pytest
 
 from queue_sim import FB, FCFS, PS, SRPT, EventLog, QueueSystem, genExp, per_server_states
@@ -8,14 +11,30 @@ NUM_EVENTS = 10_000
 VALID_KINDS = {EventLog.ARRIVAL, EventLog.DEPARTURE, EventLog.ROUTE, EventLog.REJECTION}
 
 
+@pytest.fixture(scope="module")
+def fcfs_log():
+    """Log of one M/M/1-FCFS run (lam=1, mu=2), shared by the read-only checks."""
+    server = FCFS(sizefn=genExp(2.0))
+    system = QueueSystem([server], arrivalfn=genExp(1.0))
+    system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
+    return system.event_log
+
+
+@pytest.fixture(scope="module")
+def tandem_log():
+    """Log of one 2-server FCFS tandem run (lam=1, mu=3 at each server)."""
+    s0 = FCFS(sizefn=genExp(3.0))
+    s1 = FCFS(sizefn=genExp(3.0))
+    system = QueueSystem([s0, s1], arrivalfn=genExp(1.0))
+    system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
+    return system.event_log
+
+
 class TestEventLogLength:
     """Events are logged when track_events=True."""
 
-    def test_events_logged(self):
-        server = FCFS(sizefn=genExp(2.0))
-        system = QueueSystem([server], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        assert len(system.event_log) > 0
+    def test_events_logged(self, fcfs_log):
+        assert len(fcfs_log) > 0
 
 
 class TestNoAttributeByDefault:
@@ -31,46 +50,35 @@ class TestNoAttributeByDefault:
 class TestAllKindsValid:
     """Every logged kind is one of the 4 constants."""
 
-    def test_kinds_valid(self):
-        server = FCFS(sizefn=genExp(2.0))
-        system = QueueSystem([server], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        assert all(k in VALID_KINDS for k in system.event_log.kinds)
+    def test_kinds_valid(self, fcfs_log):
+        assert all(k in VALID_KINDS for k in fcfs_log.kinds)
 
 
 class TestTimesNonDecreasing:
     """Event times must be monotonically non-decreasing."""
 
-    def test_non_decreasing(self):
-        server = FCFS(sizefn=genExp(2.0))
-        system = QueueSystem([server], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        times = system.event_log.times
-        assert all(a <= b for a, b in zip(times, times[1:]))
+    def test_non_decreasing(self, fcfs_log):
+        times = fcfs_log.times
+        assert list(times) == sorted(times)
 
 
 class TestDepartureCount:
     """Single-server no-buffer: departures == num_events."""
 
-    def test_departure_count(self):
-        server = FCFS(sizefn=genExp(2.0))
-        system = QueueSystem([server], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
-        departures = sum(1 for k in log.kinds if k == EventLog.DEPARTURE)
+    def test_departure_count(self, fcfs_log):
+        log = fcfs_log
+        departures = log.kinds.count(EventLog.DEPARTURE)
         assert departures == NUM_EVENTS
 
 
 class TestArrivalCount:
     """Single-server no-buffer: arrivals - departures == final state."""
 
-    def test_arrival_departure_balance(self):
-        server = FCFS(sizefn=genExp(2.0))
-        system = QueueSystem([server], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
-        arrivals = sum(1 for k in log.kinds if k == EventLog.ARRIVAL)
-        departures = sum(1 for k in log.kinds if k == EventLog.DEPARTURE)
+    def test_arrival_departure_balance(self, fcfs_log):
+        log = fcfs_log
+        kinds = log.kinds
+        arrivals = kinds.count(EventLog.ARRIVAL)
+        departures = kinds.count(EventLog.DEPARTURE)
         assert arrivals >= departures
         assert arrivals - departures == log.states[-1]
 
@@ -78,26 +86,20 @@ class TestArrivalCount:
 class TestStateAlwaysNonNegative:
     """System state is never negative."""
 
-    def test_state_non_negative(self):
-        server = FCFS(sizefn=genExp(2.0))
-        system = QueueSystem([server], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        assert all(s >= 0 for s in system.event_log.states)
+    def test_state_non_negative(self, fcfs_log):
+        assert min(fcfs_log.states) >= 0
 
 
 class TestFromToConsistency:
     """Departures have to==SYSTEM_EXIT, arrivals have from==EXTERNAL."""
 
-    def test_departure_to(self):
-        server = FCFS(sizefn=genExp(2.0))
-        system = QueueSystem([server], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
-        for i, k in enumerate(log.kinds):
-            if k == EventLog.DEPARTURE:
-                assert log.to_servers[i] == EventLog.SYSTEM_EXIT
-            if k == EventLog.ARRIVAL:
-                assert log.from_servers[i] == EventLog.EXTERNAL
+    def test_departure_to(self, fcfs_log):
+        log = fcfs_log
+        events = list(zip(log.kinds, log.from_servers, log.to_servers))
+        exits = {to for k, _fr, to in events if k == EventLog.DEPARTURE}
+        sources = {fr for k, fr, _to in events if k == EventLog.ARRIVAL}
+        assert exits == {EventLog.SYSTEM_EXIT}
+        assert sources == {EventLog.EXTERNAL}
 
 
 class TestBufferRejection:
@@ -108,19 +110,15 @@ class TestBufferRejection:
         system = QueueSystem([server], arrivalfn=genExp(1.0))
         system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
         log = system.event_log
-        rejections = sum(1 for k in log.kinds if k == EventLog.REJECTION)
+        rejections = log.kinds.count(EventLog.REJECTION)
         assert rejections > 0
 
 
 class TestNetworkRouting:
     """2-server tandem: ROUTE events appear with correct from/to."""
 
-    def test_route_events(self):
-        s0 = FCFS(sizefn=genExp(3.0))
-        s1 = FCFS(sizefn=genExp(3.0))
-        system = QueueSystem([s0, s1], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
+    def test_route_events(self, tandem_log):
+        log = tandem_log
         routes = [(log.from_servers[i], log.to_servers[i])
                   for i, k in enumerate(log.kinds) if k == EventLog.ROUTE]
         assert len(routes) > 0
@@ -168,11 +166,8 @@ class TestBackwardCompat:
 class TestParallelVectorsSameLength:
     """All 5 vectors have equal length."""
 
-    def test_same_length(self):
-        server = FCFS(sizefn=genExp(2.0))
-        system = QueueSystem([server], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
+    def test_same_length(self, fcfs_log):
+        log = fcfs_log
         n = len(log)
         assert len(log.times) == n
         assert len(log.kinds) == n
@@ -181,27 +176,48 @@ class TestParallelVectorsSameLength:
         assert len(log.states) == n
 
 
+@pytest.fixture(scope="class", params=[FCFS, PS, FB, SRPT])
+def policy_log(request):
+    """Log of one M/M/1 run (lam=1, mu=2) per policy, shared within the class."""
+    server = request.param(sizefn=genExp(2.0))
+    system = QueueSystem([server], arrivalfn=genExp(1.0))
+    system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
+    return system.event_log
+
+
 class TestAllPolicies:
     """Event logging works with all scheduling policies."""
 
-    @pytest.mark.parametrize("policy_cls", [FCFS, PS, FB, SRPT])
-    def test_policy(self, policy_cls):
-        server = policy_cls(sizefn=genExp(2.0))
-        system = QueueSystem([server], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
-        assert len(log) > 0
-        assert all(k in VALID_KINDS for k in log.kinds)
+    def test_policy(self, policy_log):
+        assert len(policy_log) > 0
+        assert all(k in VALID_KINDS for k in policy_log.kinds)
+
+    def test_times_non_decreasing(self, policy_log):
+        times = policy_log.times
+        assert list(times) == sorted(times)
+
+    def test_state_non_negative(self, policy_log):
+        assert min(policy_log.states) >= 0
+
+    def test_departure_count(self, policy_log):
+        departures = policy_log.kinds.count(EventLog.DEPARTURE)
+        assert departures == NUM_EVENTS
 
 
 class TestConstants:
     """Constants are accessible on the class."""
 
     def test_kind_constants(self):
-        assert EventLog.ARRIVAL == "arrival"
-        assert EventLog.DEPARTURE == "departure"
-        assert EventLog.ROUTE == "route"
-        assert EventLog.REJECTION == "rejection"
+        assert EventLog.ARRIVAL == 0
+        assert EventLog.DEPARTURE == 1
+        assert EventLog.ROUTE == 2
+        assert EventLog.REJECTION == 3
+
+    def test_kind_names(self):
+        assert EventLog.KIND_NAMES[EventLog.ARRIVAL] == "arrival"
+        assert EventLog.KIND_NAMES[EventLog.DEPARTURE] == "departure"
+        assert EventLog.KIND_NAMES[EventLog.ROUTE] == "route"
+        assert EventLog.KIND_NAMES[EventLog.REJECTION] == "rejection"
 
     def test_server_constants(self):
         assert EventLog.EXTERNAL == -1
@@ -211,35 +227,25 @@ class TestConstants:
 class TestPerServerStates:
     """Tests for per_server_states() reconstruction utility."""
 
-    def test_single_server_matches_system_state(self):
+    def test_single_server_matches_system_state(self, fcfs_log):
         """For a single server, server_states[0] should equal log.states."""
-        server = FCFS(sizefn=genExp(2.0))
-        system = QueueSystem([server], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
+        log = fcfs_log
         data = per_server_states(log)
         assert data["server_states"][0] == list(log.states)
 
-    def test_tandem_sum_equals_system_state(self):
+    def test_tandem_sum_equals_system_state(self, tandem_log):
         """For a tandem network, sum of per-server pops == system state."""
-        s0 = FCFS(sizefn=genExp(3.0))
-        s1 = FCFS(sizefn=genExp(3.0))
-        system = QueueSystem([s0, s1], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        log = system.event_log
+        log = tandem_log
         data = per_server_states(log)
-        for i in range(len(log)):
-            total = sum(data["server_states"][s][i] for s in range(2))
-            assert total == log.states[i]
+        s0, s1 = data["server_states"]
+        assert len(s0) == len(s1) == len(log)
+        assert list(map(operator.add, s0, s1)) == list(log.states)
 
-    def test_all_pops_non_negative(self):
+    def test_all_pops_non_negative(self, fcfs_log):
         """Per-server populations should never go negative."""
-        server = FCFS(sizefn=genExp(2.0))
-        system = QueueSystem([server], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        data = per_server_states(system.event_log)
+        data = per_server_states(fcfs_log)
         for s_states in data["server_states"]:
-            assert all(v >= 0 for v in s_states)
+            assert min(s_states) >= 0
 
     def test_pops_non_negative_with_buffer(self):
         """Populations stay non-negative even with buffer rejections."""
@@ -249,15 +255,11 @@ class TestPerServerStates:
         system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
         data = per_server_states(system.event_log)
         for s_states in data["server_states"]:
-            assert all(v >= 0 for v in s_states)
+            assert min(s_states) >= 0
 
-    def test_n_servers_inferred(self):
+    def test_n_servers_inferred(self, tandem_log):
         """n_servers is inferred correctly from a tandem log."""
-        s0 = FCFS(sizefn=genExp(3.0))
-        s1 = FCFS(sizefn=genExp(3.0))
-        system = QueueSystem([s0, s1], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
-        data = per_server_states(system.event_log)
+        data = per_server_states(tandem_log)
         assert len(data["server_states"]) == 2
 
     def test_n_servers_override(self):
@@ -271,6 +273,18 @@ class TestPerServerStates:
         assert all(v == 0 for v in data["server_states"][1])
         assert all(v == 0 for v in data["server_states"][2])
 
+    def test_n_servers_too_small_raises(self, tandem_log):
+        """A count below the log's servers raises instead of dropping one."""
+        pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="n_servers"):
+            per_server_states(tandem_log, n_servers=1)
+
+    def test_n_servers_too_small_raises_without_numpy(self, tandem_log, monkeypatch):
+        """The pure-Python fallback applies the same check."""
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        with pytest.raises(ValueError, match="n_servers"):
+            per_server_states(tandem_log, n_servers=1)
+
     def test_times_match_log(self):
         """Returned times should match the log times."""
         server = FCFS(sizefn=genExp(2.0))
@@ -284,3 +298,42 @@ class TestPerServerStates:
         log = EventLog()
         with pytest.raises(ValueError, match="empty"):
             per_server_states(log)
+
+    def test_numpy_matches_pure_python(self):
+        """Vectorized and pure-Python reconstructions agree on a network log."""
+        pytest.importorskip("numpy")
+        from queue_sim.event_log import _server_state_arrays, _server_states_py
+
+        s0 = FCFS(sizefn=genExp(0.8), buffer_capacity=2)
+        s1 = PS(sizefn=genExp(3.0), buffer_capacity=3)
+        tm = [[0.2, 0.5, 0.3], [0.1, 0.2, 0.7]]
+        system = QueueSystem([s0, s1], arrivalfn=genExp(1.0), transitionMatrix=tm)
+        system.sim(num_events=NUM_EVENTS, seed=42, track_events=True)
+        log = system.event_log
+        times, states = _server_state_arrays(log)
+        expected = _server_states_py(log.kinds, log.from_servers, log.to_servers, 2)
+        assert states.tolist() == expected
+        assert times.tolist() == list(log.times)
+
+
+class TestBinStepFunction:
+
+    def test_time_weighted_average(self):
+        pytest.importorskip("numpy")
+        from queue_sim.event_log import _bin_step_function
+
+        # 0 on [0, 1), 2 on [1, 3), 1 from 3 on
+        result = _bin_step_function([1.0, 3.0], [2, 1], [0.0, 2.0, 4.0])
+        assert list(result) == pytest.approx([1.0, 1.5])
+
+    def test_stacked_rows_match_single(self, tandem_log):
+        pytest.importorskip("numpy")
+        from queue_sim.event_log import _bin_step_function
+
+        data = per_server_states(tandem_log)
+        edges = [0.0, 1.0, 5.0, 5.0, 20.0, data["times"][-1]]
+        grid = _bin_step_function(data["times"], data["server_states"], edges)
+        assert grid.shape == (2, 5)
+        for s, states in enumerate(data["server_states"]):
+            row = _bin_step_function(data["times"], states, edges)
+            assert list(grid[s]) == pytest.approx(list(row))
@@ -7,13 +7,17 @@ and verify that the simulated E[N] and E[T] satisfy this identity.
 """
 
 import pytest
-from hypothesis import given, settings
+from hypothesis import Phase, given, settings
 from hypothesis import strategies as st
 
 from queue_sim import FCFS, SRPT, QueueSystem, genExp
 
+# Shrinking a statistical failure only re-runs 100k-event sims to find a
+# "smaller" (lam, mu, seed) that is no more informative, so skip it.
+_PHASES = (Phase.explicit, Phase.reuse, Phase.generate)
 
-@settings(max_examples=10, deadline=None)
+
+@settings(max_examples=10, deadline=None, phases=_PHASES)
 @given(
     lam=st.floats(min_value=0.5, max_value=5.0),
     mu=st.floats(min_value=6.0, max_value=20.0),
@@ -30,7 +34,7 @@ def test_littles_law_fcfs(lam: float, mu: float, seed: int) -> None:
     )
 
 
-@settings(max_examples=10, deadline=None)
+@settings(max_examples=10, deadline=None, phases=_PHASES)
 @given(
     lam=st.floats(min_value=0.5, max_value=5.0),
     mu=st.floats(min_value=6.0, max_value=20.0),
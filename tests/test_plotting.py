@@ -20,7 +20,16 @@ from queue_sim.plotting import (  # noqa: E402
 NUM_EVENTS = 10_000
 
 
-@pytest.fixture()
+@pytest.fixture(autouse=True)
+def _close_figures():
+    """Close every figure a test opened so they don't pile up across tests."""
+    yield
+    import matplotlib.pyplot as plt
+
+    plt.close("all")
+
+
+@pytest.fixture(scope="module")
 def response_times():
     """Generate response times from an M/M/1-FCFS queue."""
     system = QueueSystem([FCFS(sizefn=genExp(2.0))], arrivalfn=genExp(1.0))
@@ -28,7 +37,7 @@ def response_times():
     return system.response_times
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def multi_policy_rts():
     """Generate response times for FCFS, PS, and SRPT."""
     rts = {}
@@ -90,6 +99,24 @@ class TestPlotTail:
         assert ax is ax0
         plt.close("all")
 
+    def test_threshold_matches_full_tail(self, response_times):
+        _, ax_full = plot_tail(response_times)
+        _, ax_top = plot_tail(response_times, threshold=0.01)
+        full = ax_full.get_lines()[0]
+        top = ax_top.get_lines()[0]
+        n_top = len(top.get_xdata())
+        assert n_top == pytest.approx(0.01 * NUM_EVENTS, abs=1)
+        assert list(top.get_xdata()) == list(full.get_xdata()[-n_top:])
+        assert list(top.get_ydata()) == pytest.approx(list(full.get_ydata()[-n_top:]))
+
+    def test_invalid_threshold_raises(self, response_times):
+        with pytest.raises(ValueError, match="threshold"):
+            plot_tail(response_times, threshold=0)
+
+    def test_threshold_empty_input(self):
+        fig, ax = plot_tail([], threshold=0.01)
+        assert len(ax.get_lines()[0].get_xdata()) == 0
+
 
 class TestComparePolicies:
     def test_cdf_overlay(self, multi_policy_rts):
@@ -121,7 +148,7 @@ class TestComparePolicies:
         plt.close("all")
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def event_log():
     """Generate an event log from an M/M/1-FCFS queue."""
     system = QueueSystem([FCFS(sizefn=genExp(2.0))], arrivalfn=genExp(1.0))
@@ -129,7 +156,7 @@ def event_log():
     return system.event_log
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def tandem_event_log():
     """Generate an event log from a 2-server tandem."""
     s0 = FCFS(sizefn=genExp(3.0))
@@ -1,8 +1,10 @@
 """Tests for the Python-backend replicate() method and statistical helpers."""
 
+import multiprocessing
+
 import pytest
 
-from queue_sim import FCFS, QueueSystem, ReplicationResult, genExp
+from queue_sim import FCFS, SRPT, QueueSystem, ReplicationResult, genExp
 from queue_sim.results import _ci_half_width, _derive_seed, _t_inv_cdf
 
 # -- t-distribution inverse CDF ---------------------------------------------
@@ -68,11 +70,16 @@ def _make_mm1(lam: float = 1.0, mu: float = 2.0) -> QueueSystem:
     return QueueSystem([FCFS(sizefn=genExp(mu))], arrivalfn=genExp(lam))
 
 
+@pytest.fixture(scope="module")
+def mm1_rep5() -> ReplicationResult:
+    """Five seeded M/M/1 replications, shared by the read-only checks below."""
+    return _make_mm1().replicate(n_replications=5, num_events=10_000, seed=42)
+
+
 class TestReplicateBasics:
 
-    def test_returns_replication_result(self) -> None:
-        result = _make_mm1().replicate(n_replications=5, num_events=10_000, seed=42)
-        assert isinstance(result, ReplicationResult)
+    def test_returns_replication_result(self, mm1_rep5: ReplicationResult) -> None:
+        assert isinstance(mm1_rep5, ReplicationResult)
 
     def test_correct_lengths(self) -> None:
         result = _make_mm1().replicate(n_replications=10, num_events=10_000, seed=42)
@@ -89,12 +96,11 @@ class TestReplicateBasics:
         result = _make_mm1().replicate(n_replications=7, num_events=10_000, seed=42)
         assert result.n_replications == 7
 
-    def test_ci_properties(self) -> None:
-        result = _make_mm1().replicate(n_replications=5, num_events=10_000, seed=42)
-        lo, hi = result.ci_T
-        assert lo < result.mean_T < hi
-        lo_n, hi_n = result.ci_N
-        assert lo_n < result.mean_N < hi_n
+    def test_ci_properties(self, mm1_rep5: ReplicationResult) -> None:
+        lo, hi = mm1_rep5.ci_T
+        assert lo < mm1_rep5.mean_T < hi
+        lo_n, hi_n = mm1_rep5.ci_N
+        assert lo_n < mm1_rep5.mean_N < hi_n
 
 
 # -- seed determinism -------------------------------------------------------
@@ -173,3 +179,58 @@ class TestWarmup:
         r_no = sys.replicate(n_replications=5, num_events=10_000, seed=42, warmup=0)
         r_wu = sys.replicate(n_replications=5, num_events=10_000, seed=42, warmup=5000)
         assert r_no.raw_T != r_wu.raw_T
+
+
+# -- parallel ----------------------------------------------------------------
+
+class TestParallelReplicate:
+
+    def test_parallel_matches_sequential(self) -> None:
+        sys = _make_mm1()
+        r1 = sys.replicate(n_replications=6, num_events=10_000, seed=42, n_workers=1)
+        r2 = sys.replicate(n_replications=6, num_events=10_000, seed=42, n_workers=3)
+        assert r1.raw_T == r2.raw_T
+        assert r1.raw_N == r2.raw_N
+
+    def test_warmup_parallel(self) -> None:
+        sys = _make_mm1()
+        r1 = sys.replicate(
+            n_replications=4, num_events=10_000, seed=42, warmup=1000, n_workers=1,
+        )
+        r2 = sys.replicate(
+            n_replications=4, num_events=10_000, seed=42, warmup=1000, n_workers=2,
+        )
+        assert r1.raw_T == r2.raw_T
+
+    def test_srpt_parallel(self) -> None:
+        sys = QueueSystem([SRPT(sizefn=genExp(2.0))], arrivalfn=genExp(1.0))
+        r1 = sys.replicate(n_replications=4, num_events=10_000, seed=42, n_workers=1)
+        r2 = sys.replicate(n_replications=4, num_events=10_000, seed=42, n_workers=2)
+        assert r1.raw_T == r2.raw_T
+
+    def test_default_workers(self) -> None:
+        """n_workers=0 -> one per CPU, capped at n_replications."""
+        result = _make_mm1().replicate(
+            n_replications=3, num_events=10_000, seed=42, n_workers=0,
+        )
+        assert len(result.raw_T) == 3
+
+    def test_rejects_negative_workers(self) -> None:
+        with pytest.raises(ValueError, match="n_workers"):
+            _make_mm1().replicate(n_replications=3, num_events=1000, n_workers=-1)
+
+    def test_sequential_leaves_last_run_state(self) -> None:
+        sys = _make_mm1()
+        result = sys.replicate(n_replications=3, num_events=10_000, seed=42, n_workers=1)
+        assert sys.T == result.raw_T[-1]
+        assert sys.servers[0].num_completions > 0
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        reason="parallel replicate() needs the fork start method",
+    )
+    def test_parallel_leaves_system_untouched(self) -> None:
+        sys = _make_mm1()
+        sys.replicate(n_replications=3, num_events=10_000, seed=42, n_workers=3)
+        assert sys.T == 0.0
+        assert sys.servers[0].num_completions == 0
@@ -6,43 +6,47 @@ import pytest
 
 from queue_sim import FB, FCFS, PS, SRPT, QueueSystem, genExp
 
-NUM_EVENTS = 100_000
+NUM_EVENTS = 100_000  # runs whose mean is checked against RTOL
+NUM_EVENTS_SMOKE = 5_000  # length / positivity / identity checks
 RTOL = 0.05  # 5% relative tolerance
 
 
+@pytest.fixture(scope="module", params=[FCFS, PS, FB, SRPT])
+def tracked_run(request):
+    """One tracked M/M/1 run per policy, shared by the checks below.
+
+    Returns ``(response_times, T)``.
+    """
+    server = request.param(sizefn=genExp(2.0))
+    system = QueueSystem([server], arrivalfn=genExp(1.0))
+    _N, T = system.sim(
+        num_events=NUM_EVENTS, seed=42, track_response_times=True
+    )
+    return system.response_times, T
+
+
 class TestResponseTimesLength:
     """len(response_times) == num_events for every policy."""
 
-    @pytest.mark.parametrize("policy_cls", [FCFS, PS, FB, SRPT])
-    def test_length_matches_num_events(self, policy_cls):
-        server = policy_cls(sizefn=genExp(2.0))
-        system = QueueSystem([server], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_response_times=True)
-        assert len(system.response_times) == NUM_EVENTS
+    def test_length_matches_num_events(self, tracked_run):
+        response_times, _T = tracked_run
+        assert len(response_times) == NUM_EVENTS
 
 
 class TestResponseTimesPositive:
     """All response times must be positive."""
 
-    @pytest.mark.parametrize("policy_cls", [FCFS, PS, FB, SRPT])
-    def test_all_positive(self, policy_cls):
-        server = policy_cls(sizefn=genExp(2.0))
-        system = QueueSystem([server], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_response_times=True)
-        assert all(t > 0 for t in system.response_times)
+    def test_all_positive(self, tracked_run):
+        response_times, _T = tracked_run
+        assert min(response_times) > 0
 
 
 class TestResponseTimesMeanMatchesET:
     """mean(response_times) ≈ system E[T] within tolerance."""
 
-    @pytest.mark.parametrize("policy_cls", [FCFS, PS, FB, SRPT])
-    def test_mean_approx_ET(self, policy_cls):
-        server = policy_cls(sizefn=genExp(2.0))
-        system = QueueSystem([server], arrivalfn=genExp(1.0))
-        _N, T = system.sim(
-            num_events=NUM_EVENTS, seed=42, track_response_times=True
-        )
-        mean_rt = statistics.mean(system.response_times)
+    def test_mean_approx_ET(self, tracked_run):
+        response_times, T = tracked_run
+        mean_rt = statistics.fmean(response_times)
         assert mean_rt == pytest.approx(T, rel=RTOL)
 
 
@@ -52,7 +56,7 @@ class TestSRPTNowReportsT:
     def test_srpt_server_T_positive(self):
         server = SRPT(sizefn=genExp(2.0))
         system = QueueSystem([server], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42)
+        system.sim(num_events=NUM_EVENTS_SMOKE, seed=42)
         assert server.T > 0
 
 
@@ -85,9 +89,9 @@ class TestWithBufferCapacity:
     def test_buffer_capacity(self):
         server = FCFS(sizefn=genExp(2.0), buffer_capacity=10)
         system = QueueSystem([server], arrivalfn=genExp(1.0))
-        system.sim(num_events=NUM_EVENTS, seed=42, track_response_times=True)
-        assert len(system.response_times) == NUM_EVENTS
-        assert all(t > 0 for t in system.response_times)
+        system.sim(num_events=NUM_EVENTS_SMOKE, seed=42, track_response_times=True)
+        assert len(system.response_times) == NUM_EVENTS_SMOKE
+        assert min(system.response_times) > 0
 
 
 class TestMultiServer:
@@ -101,8 +105,8 @@ class TestMultiServer:
             num_events=NUM_EVENTS, seed=42, track_response_times=True
         )
         assert len(system.response_times) == NUM_EVENTS
-        assert all(t > 0 for t in system.response_times)
-        mean_rt = statistics.mean(system.response_times)
+        assert min(system.response_times) > 0
+        mean_rt = statistics.fmean(system.response_times)
         assert mean_rt == pytest.approx(T, rel=RTOL)
 
 
@@ -113,12 +117,12 @@ class TestDeterminism:
         """E[N], E[T] identical whether tracking is on or off."""
         server1 = FCFS(sizefn=genExp(2.0))
         system1 = QueueSystem([server1], arrivalfn=genExp(1.0))
-        N1, T1 = system1.sim(num_events=NUM_EVENTS, seed=42)
+        N1, T1 = system1.sim(num_events=NUM_EVENTS_SMOKE, seed=42)
 
         server2 = FCFS(sizefn=genExp(2.0))
         system2 = QueueSystem([server2], arrivalfn=genExp(1.0))
         N2, T2 = system2.sim(
-            num_events=NUM_EVENTS, seed=42, track_response_times=True
+            num_events=NUM_EVENTS_SMOKE, seed=42, track_response_times=True
         )
 
         assert N1 == N2
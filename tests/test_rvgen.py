@@ -0,0 +1,38 @@
+"""Tests for the distribution samplers in queue_sim.lib.rvGen."""
+
+import random
+
+from queue_sim import (
+    Bernoulli,
+    BoundedPareto,
+    Uniform,
+    genBernoulli,
+    genBoundedPareto,
+    genUniform,
+)
+
+
+class TestDirectSamplersMatchGenerators:
+    """A direct sampler draws exactly what its gen* counterpart would."""
+
+    def test_uniform(self) -> None:
+        random.seed(7)
+        direct = [Uniform(2.0, 5.0) for _ in range(100)]
+        random.seed(7)
+        gen = genUniform(2.0, 5.0)
+        assert direct == [gen() for _ in range(100)]
+
+    def test_bounded_pareto(self) -> None:
+        random.seed(7)
+        direct = [BoundedPareto(1.0, 1000.0, 1.5) for _ in range(100)]
+        random.seed(7)
+        gen = genBoundedPareto(1.0, 1000.0, 1.5)
+        assert direct == [gen() for _ in range(100)]
+
+    def test_bernoulli(self) -> None:
+        random.seed(7)
+        direct = [Bernoulli(0.3) for _ in range(100)]
+        random.seed(7)
+        gen = genBernoulli(0.3)
+        assert direct == [gen() for _ in range(100)]
+        assert set(direct) == {0, 1}
@@ -7,6 +7,7 @@ validation, seed reproducibility, and the Server ABC contract.
 import pytest
 
 from queue_sim import FB, FCFS, PS, SRPT, QueueSystem, Server, genExp
+from queue_sim.lib.display_system import _server_label
 
 
 class TestSeedReproducibility:
@@ -23,6 +24,20 @@ class TestSeedReproducibility:
         r2 = system.sim(num_events=10_000, seed=99)
         assert r1 != r2
 
+    @pytest.mark.parametrize("policy", [FCFS, SRPT, PS, FB])
+    def test_single_server_fast_path_matches_general_loop(self, policy) -> None:
+        """The untracked single-server loop must reproduce the general one."""
+        fast = QueueSystem([policy(sizefn=genExp(2.0), buffer_capacity=5)],
+                           arrivalfn=genExp(1.5))
+        general = QueueSystem([policy(sizefn=genExp(2.0), buffer_capacity=5)],
+                              arrivalfn=genExp(1.5))
+        r1 = fast.sim(num_events=10_000, seed=42, _warmup=100)
+        # Tracking forces the general loop without changing the draws.
+        r2 = general.sim(num_events=10_000, seed=42, _warmup=100,
+                         track_response_times=True)
+        assert r1 == r2
+        assert fast.servers[0].num_rejected == general.servers[0].num_rejected
+
 
 class TestTransitionMatrix:
 
@@ -67,7 +82,7 @@ class TestTandemNetwork:
             [FCFS(sizefn=genExp(4.0)), SRPT(sizefn=genExp(4.0))],
             arrivalfn=genExp(1.0),
         )
-        N, T = system.sim(num_events=50_000, seed=7)
+        N, T = system.sim(num_events=5_000, seed=7)
         assert N > 0
         assert T > 0
 
@@ -157,6 +172,16 @@ class TestMultiServer:
         r2 = sys_explicit.sim(num_events=10_000, seed=42)
         assert r1 == r2
 
+    def test_fcfs_subclass_override_not_shadowed(self) -> None:
+        class CountingFCFS(FCFS):
+            def arrival(self) -> None:
+                self.n_seen = getattr(self, "n_seen", 0) + 1
+                super().arrival()
+
+        server = CountingFCFS(sizefn=genExp(2.0))
+        QueueSystem([server], arrivalfn=genExp(1.0)).sim(num_events=1000, seed=42)
+        assert server.n_seen == server.num_arrivals
+
 
 class TestABCEnforcement:
 
@@ -165,6 +190,17 @@ class TestABCEnforcement:
             Server(sizefn=lambda: 1.0)  # type: ignore[abstract]
 
 
+class TestServerAttributes:
+
+    @pytest.mark.parametrize("policy", [FCFS, SRPT, PS, FB])
+    def test_name_attribute_settable(self, policy) -> None:
+        """Built-in policies accept user attributes despite __slots__."""
+        server = policy(sizefn=genExp(2.0))
+        server.name = "web"
+        assert server.name == "web"
+        assert _server_label(server, 0) == "web"
+
+
 class TestFiniteBuffer:
 
     def test_default_buffer_unlimited(self) -> None: